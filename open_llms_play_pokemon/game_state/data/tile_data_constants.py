@@ -40,8 +40,22 @@ class TilesetID(IntEnum):
     PLATEAU = 23  # Indigo Plateau
 
 
+# TilesetID members indexed by their raw tileset byte, so per-frame conversions are a
+# tuple index instead of an enum value lookup
+TILESETS_BY_ID: tuple[TilesetID, ...] = tuple(TilesetID)
+
+
 # Collision data from pokered/data/tilesets/collision_tile_ids.asm
-# These are the actual walkable tile IDs for each tileset
+# These are the actual walkable tile IDs for each tileset. Tilesets that share one
+# collision list in pokered share one frozenset here, so editing one tileset's
+# list can't silently change the others.
+_REDS_HOUSE_COLL = frozenset({0x01, 0x02, 0x03, 0x11, 0x12, 0x13, 0x14, 0x1C, 0x1A})
+_MART_COLL = frozenset({0x11, 0x1A, 0x1C, 0x3C, 0x5E})
+_DOJO_COLL = frozenset(
+    {0x11, 0x16, 0x19, 0x2B, 0x3C, 0x3D, 0x3F, 0x4A, 0x4C, 0x4D, 0x03}
+)
+_GATE_COLL = frozenset({0x01, 0x12, 0x14, 0x1A, 0x1C, 0x37, 0x38, 0x3B, 0x3C, 0x5E})
+
 COLLISION_TABLES = {
     # TilesetID -> set of walkable tile IDs (from pokered source)
     TilesetID.UNDERGROUND: {0x0B, 0x0C, 0x13, 0x15, 0x18},
@@ -66,12 +80,12 @@ COLLISION_TABLES = {
         0x58,
         0x5B,
     },
-    TilesetID.REDS_HOUSE_1: {0x01, 0x02, 0x03, 0x11, 0x12, 0x13, 0x14, 0x1C, 0x1A},
-    TilesetID.REDS_HOUSE_2: {0x01, 0x02, 0x03, 0x11, 0x12, 0x13, 0x14, 0x1C, 0x1A},
-    TilesetID.MART: {0x11, 0x1A, 0x1C, 0x3C, 0x5E},
-    TilesetID.POKECENTER: {0x11, 0x1A, 0x1C, 0x3C, 0x5E},
-    TilesetID.DOJO: {0x11, 0x16, 0x19, 0x2B, 0x3C, 0x3D, 0x3F, 0x4A, 0x4C, 0x4D, 0x03},
-    TilesetID.GYM: {0x11, 0x16, 0x19, 0x2B, 0x3C, 0x3D, 0x3F, 0x4A, 0x4C, 0x4D, 0x03},
+    TilesetID.REDS_HOUSE_1: _REDS_HOUSE_COLL,
+    TilesetID.REDS_HOUSE_2: _REDS_HOUSE_COLL,
+    TilesetID.MART: _MART_COLL,
+    TilesetID.POKECENTER: _MART_COLL,
+    TilesetID.DOJO: _DOJO_COLL,
+    TilesetID.GYM: _DOJO_COLL,
     TilesetID.FOREST: {
         0x1E,
         0x20,
@@ -90,9 +104,9 @@ COLLISION_TABLES = {
         0x5F,
     },
     TilesetID.HOUSE: {0x01, 0x12, 0x14, 0x28, 0x32, 0x37, 0x44, 0x54, 0x5C},
-    TilesetID.FOREST_GATE: {0x01, 0x12, 0x14, 0x1A, 0x1C, 0x37, 0x38, 0x3B, 0x3C, 0x5E},
-    TilesetID.MUSEUM: {0x01, 0x12, 0x14, 0x1A, 0x1C, 0x37, 0x38, 0x3B, 0x3C, 0x5E},
-    TilesetID.GATE: {0x01, 0x12, 0x14, 0x1A, 0x1C, 0x37, 0x38, 0x3B, 0x3C, 0x5E},
+    TilesetID.FOREST_GATE: _GATE_COLL,
+    TilesetID.MUSEUM: _GATE_COLL,
+    TilesetID.GATE: _GATE_COLL,
     TilesetID.SHIP: {0x04, 0x0D, 0x17, 0x1D, 0x1E, 0x23, 0x34, 0x37, 0x39, 0x4A},
     TilesetID.SHIP_PORT: {0x0A, 0x1A, 0x32, 0x3B},
     TilesetID.CEMETERY: {0x01, 0x10, 0x13, 0x1B, 0x22, 0x42, 0x52},
@@ -0,0 +1,134 @@
+"""
+Precomputed Tile Property Lookup Tables for Pokemon Red
+
+Packs the per-tileset tile sets from tile_data_constants into a single
+(tileset, tile_id) table of bit flags, so the static properties of a tile can
+be resolved with one table load instead of a chain of dict and set lookups.
+"""
+
+import numpy as np
+
+from .tile_data_constants import (
+    BOOKSHELF_TILES,
+    COLLISION_TABLES,
+    DOOR_TILES,
+    GRASS_TILES,
+    LEDGE_TILES,
+    PC_TILES,
+    SIGN_TILES,
+    STRENGTH_BOULDER_TILES,
+    TREE_TILES,
+    WARP_TILES,
+    WATER_TILES,
+    TilesetID,
+)
+
+NUM_TILESETS = len(TilesetID)
+NUM_TILE_IDS = 256
+
+# Property bits stored in TILE_PROPERTY_FLAGS
+GRASS = 1 << 0
+WATER = 1 << 1
+WARP = 1 << 2
+DOOR = 1 << 3
+LEDGE = 1 << 4
+TREE = 1 << 5
+SIGN = 1 << 6
+BOOKSHELF = 1 << 7
+STRENGTH_BOULDER = 1 << 8
+PC = 1 << 9
+
+# Any of the bits a player can interact with
+INTERACTION = SIGN | BOOKSHELF | STRENGTH_BOULDER | TREE | PC
+
+
+def _build_property_flags() -> np.ndarray:
+    flags = np.zeros((NUM_TILESETS, NUM_TILE_IDS), dtype=np.uint16)
+    tables = (
+        (GRASS_TILES, GRASS),
+        (WATER_TILES, WATER),
+        (WARP_TILES, WARP),
+        (DOOR_TILES, DOOR),
+        (TREE_TILES, TREE),
+        (SIGN_TILES, SIGN),
+        (BOOKSHELF_TILES, BOOKSHELF),
+        (STRENGTH_BOULDER_TILES, STRENGTH_BOULDER),
+        (PC_TILES, PC),
+    )
+    for table, flag in tables:
+        for tileset_id, tile_ids in table.items():
+            flags[tileset_id, sorted(tile_ids)] |= flag
+
+    for tileset_id, directions in LEDGE_TILES.items():
+        for tile_ids in directions.values():
+            flags[tileset_id, sorted(tile_ids)] |= LEDGE
+
+    flags.setflags(write=False)
+    return flags
+
+
+# TILE_PROPERTY_FLAGS[tileset_id, tile_id] -> OR of the property bits above. Built
+# at import from the constant tables: this takes ~0.1 ms, about what loading a
+# pregenerated .npz costs, and cannot go stale when the tables change.
+TILE_PROPERTY_FLAGS = _build_property_flags()
+
+# Boolean (tileset_id, tile_id) masks for whole-grid lookups, e.g.
+# GRASS_MASK[tileset_id][tile_ids] for an array of tile ids
+GRASS_MASK = (TILE_PROPERTY_FLAGS & GRASS) != 0
+WATER_MASK = (TILE_PROPERTY_FLAGS & WATER) != 0
+WARP_MASK = (TILE_PROPERTY_FLAGS & WARP) != 0
+DOOR_MASK = (TILE_PROPERTY_FLAGS & DOOR) != 0
+LEDGE_MASK = (TILE_PROPERTY_FLAGS & LEDGE) != 0
+TREE_MASK = (TILE_PROPERTY_FLAGS & TREE) != 0
+SIGN_MASK = (TILE_PROPERTY_FLAGS & SIGN) != 0
+BOOKSHELF_MASK = (TILE_PROPERTY_FLAGS & BOOKSHELF) != 0
+STRENGTH_BOULDER_MASK = (TILE_PROPERTY_FLAGS & STRENGTH_BOULDER) != 0
+PC_MASK = (TILE_PROPERTY_FLAGS & PC) != 0
+
+
+def _build_walkable_mask() -> np.ndarray:
+    walkable = np.zeros((NUM_TILESETS, NUM_TILE_IDS), dtype=np.bool_)
+    for tileset_id, tile_ids in COLLISION_TABLES.items():
+        walkable[tileset_id, sorted(tile_ids)] = True
+    walkable.setflags(write=False)
+    return walkable
+
+
+# WALKABLE_MASK[tileset_id, tile_id] -> tile is in the tileset's collision table,
+# which lists the tiles the player can walk on
+WALKABLE_MASK = _build_walkable_mask()
+
+# Nested-list copies for scalar lookups, which are much cheaper than indexing numpy
+_TILE_PROPERTY_FLAGS_LIST: list[list[int]] = TILE_PROPERTY_FLAGS.tolist()
+_WALKABLE_LIST: list[list[bool]] = WALKABLE_MASK.tolist()
+
+
+def tile_property_flags(tileset_id: int, tile_id: int) -> int:
+    """
+    Look up the packed property bits for a single tile.
+
+    Args:
+        tileset_id: Current tileset ID
+        tile_id: Tile ID to look up
+
+    Returns:
+        Bitwise OR of the property flags that apply to the tile, 0 for unknown
+        tilesets and tile IDs
+    """
+    if not (0 <= tileset_id < NUM_TILESETS and 0 <= tile_id < NUM_TILE_IDS):
+        return 0
+    return _TILE_PROPERTY_FLAGS_LIST[tileset_id][tile_id]
+
+
+def is_walkable_tile_id(tileset_id: int, tile_id: int) -> bool:
+    """
+    Look up whether a tile is walkable according to the tileset collision table.
+
+    Args:
+        tileset_id: Current tileset ID
+        tile_id: Tile ID to look up
+
+    Returns:
+        True if the tile is walkable, False if it blocks movement
+    """
+    return _WALKABLE_LIST[tileset_id][tile_id]
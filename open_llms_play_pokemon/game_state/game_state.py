@@ -5,7 +5,7 @@ This module defines the data structures for representing Pokemon Red game states
 and evaluation examples.
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields, is_dataclass
 
 from .tile_data import TileMatrix
 
@@ -69,4 +69,20 @@ class PokemonRedGameState:
         Returns:
             Dictionary representation suitable for MLFlow logging
         """
-        return asdict(self)
+        data = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, TileMatrix):
+                # Column arrays are not JSON-friendly; use the per-tile form
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [
+                    asdict(item)
+                    if is_dataclass(item) and not isinstance(item, type)
+                    else item
+                    for item in value
+                ]
+            elif is_dataclass(value) and not isinstance(value, type):
+                value = asdict(value)
+            data[field.name] = value
+        return data
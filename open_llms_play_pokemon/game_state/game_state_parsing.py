@@ -8,6 +8,16 @@ from open_llms_play_pokemon.game_state.memory_reader import PokemonRedMemoryRead
 
 logger = logging.getLogger(__name__)
 
+# Tile dict fields that offer an interaction, with the label shown for each
+_INTERACTION_LABELS = (
+    ("has_sign", "Sign (read)"),
+    ("pc_accessible", "PC (access)"),
+    ("is_warp_tile", "Door/Warp"),
+    ("cuttable_tree", "Tree (cut)"),
+    ("strength_boulder", "Boulder (push)"),
+    ("trainer_sight_line", "Trainer nearby"),
+)
+
 
 def get_game_state_json(state_file_path: str) -> dict[str, Any]:
     """
@@ -226,48 +236,22 @@ def format_game_state_text(game_state: dict[str, Any]) -> str:
     if tile_matrix and isinstance(tile_matrix, dict):
         tiles = tile_matrix.get("tiles", [])
         if tiles:
-            # Analyze nearby tiles for environmental features
-            interaction_options = []
-
-            # Count tile types in immediate vicinity
-            tile_counts = {}
-            total_tiles = 0
+            # Collect interactive features in first-seen order, deduplicated as
+            # they are found
+            interaction_options: dict[str, None] = {}
 
             for row in tiles:
                 if isinstance(row, list):
                     for tile in row:
                         if isinstance(tile, dict):
-                            total_tiles += 1
-                            tile_type = tile.get("tile_type", "unknown")
-                            # Convert enum to string if needed
-                            if hasattr(tile_type, "name"):
-                                tile_type = tile_type.name.lower()
-                            elif hasattr(tile_type, "value"):
-                                tile_type = str(tile_type.value).lower()
-                            else:
-                                tile_type = str(tile_type).lower()
-                            tile_counts[tile_type] = tile_counts.get(tile_type, 0) + 1
-
-                            # Check for interactive features
-                            if tile.get("has_sign"):
-                                interaction_options.append("Sign (read)")
-                            if tile.get("pc_accessible"):
-                                interaction_options.append("PC (access)")
-                            if tile.get("is_warp_tile"):
-                                interaction_options.append("Door/Warp")
-                            if tile.get("cuttable_tree"):
-                                interaction_options.append("Tree (cut)")
-                            if tile.get("strength_boulder"):
-                                interaction_options.append("Boulder (push)")
-                            if tile.get("trainer_sight_line"):
-                                interaction_options.append("Trainer nearby")
+                            for field, label in _INTERACTION_LABELS:
+                                if tile.get(field):
+                                    interaction_options[label] = None
 
             # Show interaction options if any exist
             if interaction_options:
                 lines.append("ENVIRONMENT:")
-                unique_interactions = list(
-                    dict.fromkeys(interaction_options)
-                )  # Remove duplicates
+                unique_interactions = list(interaction_options)
                 lines.append(
                     f"Actions: {', '.join(unique_interactions[:5])}"
                 )  # Limit to 5 most important
@@ -286,33 +270,28 @@ def format_game_state_text(game_state: dict[str, Any]) -> str:
             )
             # Process every 2x2 grid area, showing only bottom-left tile info
             for grid_y in range(0, 18, 2):  # Step by 2 for 2x2 areas
-                grid_line = ""
+                # Bottom-left row of this band of 2x2 areas
+                row = tiles[grid_y + 1]
+                symbols = []
                 for grid_x in range(0, 20, 2):  # Step by 2 for 2x2 areas
-                    # Bottom-left position of this 2x2 area
-                    bottom_left_x = grid_x
-                    bottom_left_y = grid_y + 1
-
                     # Check if this 2x2 area contains the player sprite (at 8,9-9,10)
                     if grid_x == 8 and grid_y == 8:  # Player's 2x2 area
-                        grid_line += "@ "
-                    elif (
-                        bottom_left_y < len(tiles)
-                        and bottom_left_x < len(tiles[bottom_left_y])
-                        and isinstance(tiles[bottom_left_y][bottom_left_x], dict)
-                    ):
+                        symbols.append("@")
+                    elif grid_x < len(row) and isinstance(row[grid_x], dict):
                         # Use bottom-left tile's properties for the entire 2x2 area
-                        tile = tiles[bottom_left_y][bottom_left_x]
+                        tile = row[grid_x]
 
                         # Check for warp tile first (priority over walkable)
                         if tile.get("is_warp_tile", False):
-                            grid_line += "W "
+                            symbols.append("W")
                         elif tile.get("is_walkable", False):
-                            grid_line += ". "
+                            symbols.append(".")
                         else:
-                            grid_line += "X "
+                            symbols.append("X")
                     else:
-                        grid_line += "? "
-                lines.append(grid_line)
+                        symbols.append("?")
+                # Every symbol is followed by a space, including the last one
+                lines.append(" ".join(symbols) + " ")
             lines.append("")
 
     # Map loading status - only show if actively transitioning (1-3 are transition states)
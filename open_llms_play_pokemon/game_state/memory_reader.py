@@ -8,9 +8,17 @@ from .game_state import (
     PokemonHp,
     PokemonRedGameState,
 )
-from .tile_data import TileMatrix
+from .tile_data import WALKABLE_BIT, TileMatrix
 from .tile_data_factory import TileDataFactory
-from .tile_reader import read_entire_screen
+from .tile_reader import ScreenInputs, build_tile_matrix, read_screen_inputs
+
+# Party Pokemon structs are stored back to back from 0xD16B, 44 bytes each.
+# HP and max HP are big-endian 16-bit values.
+_PARTY_DATA_START = 0xD16B
+_PARTY_MON_SIZE = 44
+_PARTY_HP_OFFSET = MemoryAddresses.party_mon_1_hp - _PARTY_DATA_START
+_PARTY_LEVEL_OFFSET = MemoryAddresses.party_mon_1_level - _PARTY_DATA_START
+_PARTY_MAX_HP_OFFSET = MemoryAddresses.party_mon_1_max_hp - _PARTY_DATA_START
 
 
 class PokemonRedMemoryReader:
@@ -24,6 +32,10 @@ class PokemonRedMemoryReader:
 
     def __init__(self, pyboy):
         self.pyboy = pyboy
+        # Last screen read and the matrix built from it, reused while the screen
+        # is unchanged (menus, dialogs and battles leave it static for many frames)
+        self._last_screen: ScreenInputs | None = None
+        self._last_screen_matrix: TileMatrix | None = None
 
     def parse_game_state(
         self, memory_view: PyBoyMemoryView, step_counter: int = 0, timestamp: str = ""
@@ -32,36 +44,33 @@ class PokemonRedMemoryReader:
 
         # Read basic game state values
         party_count = memory_view[MemoryAddresses.party_count]
-        badges_count = bin(memory_view[MemoryAddresses.obtained_badges]).count("1")
+        badges_count = memory_view[MemoryAddresses.obtained_badges].bit_count()
         is_in_battle = memory_view[MemoryAddresses.is_in_battle]
         current_map = memory_view[MemoryAddresses.current_map]
         player_x = memory_view[MemoryAddresses.x_coord]
         player_y = memory_view[MemoryAddresses.y_coord]
 
-        # Parse party Pokemon data using bulk slice reads
+        # Parse party Pokemon data from one read of the contiguous party structs
         party_levels = []
         party_hp = []
 
         if party_count > 0:
-            level_addrs = [0xD18C, 0xD1B8, 0xD1E4, 0xD210, 0xD23C, 0xD268]
-            hp_addrs = [0xD16C, 0xD198, 0xD1C4, 0xD1F0, 0xD21C, 0xD248]
-            max_hp_addrs = [0xD18D, 0xD1B9, 0xD1E5, 0xD211, 0xD23D, 0xD269]
-
             count = min(party_count, 6)
-
-            party_levels = [
-                memory_view[level_addr] for level_addr in level_addrs[:count]
-            ]
-
-            current_hps = PokemonRedMemoryReader._read_multiple_16bit(
-                memory_view, hp_addrs[:count]
-            )
-            max_hps = PokemonRedMemoryReader._read_multiple_16bit(
-                memory_view, max_hp_addrs[:count]
+            party_data = bytes(
+                memory_view[
+                    _PARTY_DATA_START : _PARTY_DATA_START + count * _PARTY_MON_SIZE
+                ]
             )
+
+            party_levels = list(party_data[_PARTY_LEVEL_OFFSET::_PARTY_MON_SIZE])
             party_hp = [
-                PokemonHp(current=current, max=max_hp)
-                for current, max_hp in zip(current_hps, max_hps, strict=True)
+                PokemonHp(
+                    current=(party_data[base + _PARTY_HP_OFFSET] << 8)
+                    | party_data[base + _PARTY_HP_OFFSET + 1],
+                    max=(party_data[base + _PARTY_MAX_HP_OFFSET] << 8)
+                    | party_data[base + _PARTY_MAX_HP_OFFSET + 1],
+                )
+                for base in range(0, len(party_data), _PARTY_MON_SIZE)
             ]
 
         # Battle state
@@ -90,7 +99,6 @@ class PokemonRedMemoryReader:
         map_loading_status = memory_view[MemoryAddresses.map_loading_status]
         current_tileset = memory_view[MemoryAddresses.current_tileset]
 
-        # Process all tile data using unified method
         tile_data = self._process_tile_data(memory_view)
 
         return PokemonRedGameState(
@@ -123,21 +131,33 @@ class PokemonRedMemoryReader:
         Returns:
             Dictionary with tile matrix and directions available
         """
-        # Get all tiles in one pass
-        all_tiles = read_entire_screen(memory_view)
-
-        # Create TileMatrix from all_tiles (20x18 screen)
-        tile_matrix = self._create_tile_matrix(memory_view, all_tiles)
+        # Read the whole screen in one pass
+        screen = read_screen_inputs(memory_view)
+
+        if screen is None:
+            # Map is transitioning: report placeholders and don't block movement
+            return {
+                "tile_matrix": self._create_placeholder_matrix(memory_view),
+                "directions_available": DirectionsAvailable(
+                    north=True, south=True, east=True, west=True
+                ),
+            }
+
+        tile_matrix = self._last_screen_matrix
+        if tile_matrix is None or screen != self._last_screen:
+            tile_matrix = build_tile_matrix(memory_view, screen)
+            self._last_screen = screen
+            self._last_screen_matrix = tile_matrix
 
         return {
             "tile_matrix": tile_matrix,
             "directions_available": self._check_immediate_directions(
-                all_tiles, self.PLAYER_SCREEN_X, self.PLAYER_SCREEN_Y
+                tile_matrix, self.PLAYER_SCREEN_X, self.PLAYER_SCREEN_Y
             ),
         }
 
     def _check_immediate_directions(
-        self, all_tiles: list, player_top_left_x: int, player_top_left_y: int
+        self, tile_matrix: TileMatrix, player_top_left_x: int, player_top_left_y: int
     ) -> DirectionsAvailable:
         """Check walkability in each direction for Pokemon Red movement.
 
@@ -161,24 +181,18 @@ class PokemonRedMemoryReader:
             check_y = player_top_left_y + dy
 
             # Check if target position is within screen bounds
-            if not (0 <= check_x < 20 and 0 <= check_y < 18):
+            if not (
+                0 <= check_x < tile_matrix.width and 0 <= check_y < tile_matrix.height
+            ):
                 # Position is outside screen bounds - assume walkable (map boundary)
                 # Pokemon Red typically allows movement at map edges unless blocked
                 directions_dict[direction] = True
                 continue
 
-            # Find tile at this position
-            tile = next(
-                (t for t in all_tiles if t.x == check_x and t.y == check_y), None
+            directions_dict[direction] = bool(
+                tile_matrix.scan_flags[check_y, check_x] & WALKABLE_BIT
             )
 
-            if tile is None:
-                # Tile not found in all_tiles list - this shouldn't happen for valid coords
-                # Fall back to assuming walkable to avoid blocking valid movement
-                directions_dict[direction] = True
-            else:
-                directions_dict[direction] = tile.is_walkable
-
         return DirectionsAvailable(
             north=directions_dict["north"],
             south=directions_dict["south"],
@@ -186,62 +200,44 @@ class PokemonRedMemoryReader:
             west=directions_dict["west"],
         )
 
-    def _create_tile_matrix(
-        self, memory_view: PyBoyMemoryView, all_tiles: list
-    ) -> TileMatrix:
+    def _create_placeholder_matrix(self, memory_view: PyBoyMemoryView) -> TileMatrix:
         """
-        Create a TileMatrix from the list of tiles.
+        Create a TileMatrix of placeholder tiles for frames without tile data.
 
         Args:
             memory_view: PyBoy memory view for getting player position and map info
-            all_tiles: List of TileData objects from analyze_screen
 
         Returns:
-            TileMatrix with 2D array of tiles
+            TileMatrix filled with placeholder tiles
         """
         # GameBoy screen is 20x18 tiles
         width, height = 20, 18
 
-        # Initialize 2D matrix with placeholder tiles
-        matrix = [
-            [TileDataFactory.create_placeholder(x, y) for x in range(width)]
-            for y in range(height)
-        ]
-
-        # Fill matrix with actual tiles
-        for tile in all_tiles:
-            if 0 <= tile.x < width and 0 <= tile.y < height:
-                matrix[tile.y][tile.x] = tile
-
-        # Get current map info
-        current_map = memory_view[MemoryAddresses.current_map]
-        player_x = memory_view[MemoryAddresses.x_coord]
-        player_y = memory_view[MemoryAddresses.y_coord]
-
-        return TileMatrix(
-            tiles=matrix,
+        return TileMatrix.from_tiles(
+            tiles=TileDataFactory.create_placeholder_grid(width, height),
             width=width,
             height=height,
-            current_map=current_map,
-            player_x=player_x,
-            player_y=player_y,
+            current_map=memory_view[MemoryAddresses.current_map],
+            player_x=memory_view[MemoryAddresses.x_coord],
+            player_y=memory_view[MemoryAddresses.y_coord],
             timestamp=None,  # Could add frame counter if needed
         )
 
     @staticmethod
     def _read_16bit(memory_view: PyBoyMemoryView, start_addr: int) -> int:
+        # Pokemon Red stores 16-bit values such as HP big-endian
         hp_bytes = memory_view[start_addr : start_addr + 2]
-        return hp_bytes[0] + (hp_bytes[1] << 8)
+        return (hp_bytes[0] << 8) | hp_bytes[1]
 
     @staticmethod
     def _read_multiple_16bit(
         memory_view: PyBoyMemoryView, addresses: Sequence[int]
     ) -> list[int]:
-        """Read multiple 16-bit values efficiently"""
+        """Read multiple big-endian 16-bit values efficiently"""
         values = []
         for addr in addresses:
             bytes_data = memory_view[addr : addr + 2]
-            values.append(bytes_data[0] + (bytes_data[1] << 8))
+            values.append((bytes_data[0] << 8) | bytes_data[1])
         return values
 
     @staticmethod
@@ -253,7 +249,7 @@ class PokemonRedMemoryReader:
 
         # Convert all bytes to bits in one comprehension
         event_bits = [
-            int(bin(256 + byte_val)[-bit_pos - 1])
+            (byte_val >> bit_pos) & 1
             for byte_val in event_bytes
             for bit_pos in range(8)
         ]
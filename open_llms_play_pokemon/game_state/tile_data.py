@@ -6,20 +6,30 @@ collision properties, and position data into serializable formats.
 """
 
 import json
-from dataclasses import asdict, dataclass
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
 
 import numpy as np
 
-from .data.tile_data_constants import (
-    COLLISION_TABLES,
-    DOOR_TILES,
-    GRASS_TILES,
-    LEDGE_TILES,
-    TREE_TILES,
-    WARP_TILES,
-    WATER_TILES,
-    TilesetID,
+from .data.tile_data_constants import TILESETS_BY_ID, TilesetID
+from .data.tile_masks import (
+    DOOR,
+    DOOR_MASK,
+    GRASS,
+    GRASS_MASK,
+    LEDGE,
+    LEDGE_MASK,
+    NUM_TILE_IDS,
+    NUM_TILESETS,
+    TREE,
+    TREE_MASK,
+    WARP,
+    WARP_MASK,
+    WATER,
+    WATER_MASK,
+    is_walkable_tile_id,
+    tile_property_flags,
 )
 
 
@@ -41,6 +51,15 @@ class TileType(Enum):
     ITEM = "item"
 
 
+# TileType members indexed by the uint8 code stored in TileMatrix columns
+TILE_TYPES: tuple[TileType, ...] = tuple(TileType)
+TILE_TYPE_CODES: dict[TileType, int] = {
+    tile_type: code for code, tile_type in enumerate(TILE_TYPES)
+}
+_TILE_TYPE_ARRAY = np.array(TILE_TYPES, dtype=object)
+_TILE_TYPE_VALUES = tuple(tile_type.value for tile_type in TILE_TYPES)
+
+
 @dataclass(slots=True, frozen=True)
 class TileData:
     """
@@ -120,11 +139,77 @@ class TileData:
         return cls(**data)
 
 
-@dataclass(slots=True, frozen=True)
+# Storage type of each TileData field inside a TileMatrix. Screen x/y are implied
+# by the array position; tile_type holds TILE_TYPE_CODES and object columns hold
+# optional or free-form values.
+TILE_MATRIX_COLUMNS: dict[str, type] = {
+    "tile_id": np.uint8,
+    "map_x": np.int16,
+    "map_y": np.int16,
+    "tile_type": np.uint8,
+    "tileset_id": np.uint8,
+    "raw_value": np.uint8,
+    "is_walkable": np.bool_,
+    "is_ledge_tile": np.bool_,
+    "ledge_direction": object,
+    "movement_modifier": np.float32,
+    "is_encounter_tile": np.bool_,
+    "is_warp_tile": np.bool_,
+    "is_animated": np.bool_,
+    "light_level": np.uint8,
+    "has_sign": np.bool_,
+    "has_bookshelf": np.bool_,
+    "strength_boulder": np.bool_,
+    "cuttable_tree": np.bool_,
+    "pc_accessible": np.bool_,
+    "trainer_sight_line": np.bool_,
+    "trainer_id": object,
+    "hidden_item_id": object,
+    "requires_itemfinder": np.bool_,
+    "safari_zone_steps": np.bool_,
+    "game_corner_tile": np.bool_,
+    "is_fly_destination": np.bool_,
+    "has_footstep_sound": np.bool_,
+    "sprite_priority": np.uint8,
+    "background_priority": np.uint8,
+    "elevation_pair": object,
+    "sprite_offset": np.uint8,
+    "blocks_light": np.bool_,
+    "water_current_direction": object,
+    "warp_destination_map": object,
+    "warp_destination_x": object,
+    "warp_destination_y": object,
+}
+
+_TILE_FIELD_NAMES = tuple(field.name for field in fields(TileData))
+
+# Bits of TileMatrix.scan_flags, which packs the boolean columns most scans touch
+WALKABLE_BIT = 1 << 0
+ENCOUNTER_BIT = 1 << 1
+WARP_BIT = 1 << 2
+ANIMATED_BIT = 1 << 3
+
+_SCAN_FLAG_COLUMNS = (
+    ("is_walkable", WALKABLE_BIT),
+    ("is_encounter_tile", ENCOUNTER_BIT),
+    ("is_warp_tile", WARP_BIT),
+    ("is_animated", ANIMATED_BIT),
+)
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class TileMatrix:
     """
     Complete tile data matrix for a game area.
 
+    Tiles are stored column-wise: every TileData field except the screen position
+    is a (height, width) numpy array indexed [y, x]. Scans such as walkability or
+    encounter checks read one compact array instead of visiting 360 objects, and
+    TileData objects are only built for the tiles a caller asks for.
+
+    Matrices compare by value: the scalar fields must match and every column
+    must hold equal arrays. They are unhashable, like the arrays they hold.
+
     Screen Coordinates vs World Coordinates:
     - Screen: 20x18 tiles (160x144 pixels / 8x8 pixel tiles)
     - Player sprite: Always at screen tiles (8,9)-(9,10) [2x2 tiles, 16x16 pixels]
@@ -137,51 +222,216 @@ class TileMatrix:
     - player_x, player_y: World coordinates (stored in game memory)
 
     Attributes:
-        tiles: 2D matrix of TileData objects [tiles[y][x] format]
+        columns: Per-field arrays keyed by TileData field name (see
+            TILE_MATRIX_COLUMNS), each of shape (height, width). The matrix takes
+            ownership of these arrays and marks them read-only, so callers must
+            pass arrays they don't write to or share afterwards
         width: Width of the matrix (always 20 for Pokemon Red)
         height: Height of the matrix (always 18 for Pokemon Red)
         current_map: Map ID where this data was captured
         player_x: Player's world X position when data was captured
         player_y: Player's world Y position when data was captured
         timestamp: When this data was captured (frame count or timestamp)
+        scan_flags: (height, width) uint8 array packing the walkable, encounter,
+            warp and animated columns as WALKABLE_BIT, ENCOUNTER_BIT, WARP_BIT and
+            ANIMATED_BIT, so combined scans read a single byte per tile
     """
 
-    tiles: list[list[TileData]]
+    columns: dict[str, np.ndarray]
     width: int
     height: int
     current_map: int
     player_x: int
     player_y: int
     timestamp: int | None = None
+    scan_flags: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        scan_flags = np.zeros((self.height, self.width), dtype=np.uint8)
+        for name, bit in _SCAN_FLAG_COLUMNS:
+            scan_flags[self.columns[name]] |= bit
+        # Matrices are shared between callers (see PokemonRedMemoryReader), so
+        # the arrays are made read-only to keep one caller from changing another's.
+        # They are frozen in place rather than copied: every constructor
+        # (build_tile_matrix, from_tiles) hands over freshly built arrays.
+        for column in self.columns.values():
+            column.setflags(write=False)
+        scan_flags.setflags(write=False)
+        object.__setattr__(self, "scan_flags", scan_flags)
+
+    # numpy columns have no single truth value under ==, so the generated
+    # dataclass comparison can't be used
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TileMatrix):
+            return NotImplemented
+        return (
+            self.width == other.width
+            and self.height == other.height
+            and self.current_map == other.current_map
+            and self.player_x == other.player_x
+            and self.player_y == other.player_y
+            and self.timestamp == other.timestamp
+            and self.columns.keys() == other.columns.keys()
+            and all(
+                np.array_equal(column, other.columns[name])
+                for name, column in self.columns.items()
+            )
+        )
+
+    @classmethod
+    def from_tiles(
+        cls,
+        tiles: list[list[TileData]],
+        width: int,
+        height: int,
+        current_map: int,
+        player_x: int,
+        player_y: int,
+        timestamp: int | None = None,
+    ) -> "TileMatrix":
+        """Create a TileMatrix from a 2D list of TileData objects [tiles[y][x]]."""
+        columns = {
+            name: np.array(
+                [[getattr(tile, name) for tile in row] for row in tiles], dtype=dtype
+            ).reshape(height, width)
+            for name, dtype in TILE_MATRIX_COLUMNS.items()
+            if name != "tile_type"
+        }
+        columns["tile_type"] = np.array(
+            [[TILE_TYPE_CODES[tile.tile_type] for tile in row] for row in tiles],
+            dtype=np.uint8,
+        ).reshape(height, width)
+        return cls(
+            columns=columns,
+            width=width,
+            height=height,
+            current_map=current_map,
+            player_x=player_x,
+            player_y=player_y,
+            timestamp=timestamp,
+        )
+
+    @property
+    def tile_ids(self) -> np.ndarray:
+        """Tile IDs as a (height, width) uint8 array."""
+        return self.columns["tile_id"]
+
+    @property
+    def walkable_mask(self) -> np.ndarray:
+        """Boolean (height, width) array of walkable tiles."""
+        return self.columns["is_walkable"]
+
+    @property
+    def encounter_mask(self) -> np.ndarray:
+        """Boolean (height, width) array of wild encounter tiles."""
+        return self.columns["is_encounter_tile"]
+
+    @property
+    def warp_mask(self) -> np.ndarray:
+        """Boolean (height, width) array of warp tiles."""
+        return self.columns["is_warp_tile"]
+
+    @property
+    def tiles(self) -> list[list[TileData]]:
+        """2D list of TileData objects [tiles[y][x] format], built on access."""
+        rows = self._field_rows(TILE_TYPES, TILESETS_BY_ID)
+        return [
+            [TileData(*values) for values in zip(*row, strict=True)] for row in rows
+        ]
+
+    def _field_rows(
+        self, tile_types: tuple, tilesets: tuple | None = None
+    ) -> list[list[list]]:
+        # Per screen row, one list of values per TileData field in field order, so
+        # whole rows of tiles can be zipped together from the columns. tile_type
+        # (and tileset_id, if given) codes are mapped through the lookup tables.
+        column_rows = {name: column.tolist() for name, column in self.columns.items()}
+        if tilesets is not None:
+            column_rows["tileset_id"] = [
+                [tilesets[code] for code in row] for row in column_rows["tileset_id"]
+            ]
+        column_rows["tile_type"] = [
+            [tile_types[code] for code in row] for row in column_rows["tile_type"]
+        ]
+        xs = list(range(self.width))
+        return [
+            [
+                xs
+                if name == "x"
+                else [y] * self.width
+                if name == "y"
+                else column_rows[name][y]
+                for name in _TILE_FIELD_NAMES
+            ]
+            for y in range(self.height)
+        ]
+
+    def _build_tile(self, x: int, y: int) -> TileData:
+        values = {name: column.item(y, x) for name, column in self.columns.items()}
+        values["x"] = x
+        values["y"] = y
+        values["tileset_id"] = TILESETS_BY_ID[values["tileset_id"]]
+        values["tile_type"] = TILE_TYPES[values["tile_type"]]
+        return TileData(*(values[name] for name in _TILE_FIELD_NAMES))
 
     def get_tile(self, x: int, y: int) -> TileData | None:
         """Get tile data at specific coordinates."""
         if 0 <= y < self.height and 0 <= x < self.width:
-            return self.tiles[y][x]
+            return self._build_tile(x, y)
         return None
 
     def get_walkable_tiles(self) -> list[TileData]:
         """Get all walkable tiles in the matrix."""
-        walkable = []
-        for row in self.tiles:
-            for tile in row:
-                if tile.is_walkable:
-                    walkable.append(tile)
-        return walkable
+        return [
+            self._build_tile(x, y)
+            for y, x in np.argwhere(self.scan_flags & WALKABLE_BIT).tolist()
+        ]
+
+    def get_walkable_positions(self) -> list[tuple[int, int]]:
+        """Get the (x, y) screen positions of all walkable tiles."""
+        return [(x, y) for y, x in np.argwhere(self.scan_flags & WALKABLE_BIT).tolist()]
+
+    def iter_tiles(self) -> Iterator[TileData]:
+        """Iterate over all tiles in row order, building each one as it is reached."""
+        for y in range(self.height):
+            for x in range(self.width):
+                yield self._build_tile(x, y)
 
     def get_tiles_by_type(self, tile_type: TileType) -> list[TileData]:
         """Get all tiles of a specific type."""
-        matching = []
-        for row in self.tiles:
-            for tile in row:
-                if tile.tile_type == tile_type:
-                    matching.append(tile)
-        return matching
+        return [
+            self._build_tile(x, y)
+            for y, x in np.argwhere(
+                self.columns["tile_type"] == TILE_TYPE_CODES[tile_type]
+            ).tolist()
+        ]
+
+    def count_tile_types(self) -> dict[TileType, int]:
+        """Count the tiles of each type present in the matrix."""
+        counts = np.bincount(
+            self.columns["tile_type"].ravel(), minlength=len(TILE_TYPES)
+        )
+        return {
+            TILE_TYPES[code]: count
+            for code, count in enumerate(counts.tolist())
+            if count
+        }
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        rows = self._field_rows(_TILE_TYPE_VALUES)
+        tiles = [
+            [
+                dict(zip(_TILE_FIELD_NAMES, values, strict=True))
+                for values in zip(*row, strict=True)
+            ]
+            for row in rows
+        ]
+
         return {
-            "tiles": [[tile.to_dict() for tile in row] for row in self.tiles],
+            "tiles": tiles,
             "width": self.width,
             "height": self.height,
             "current_map": self.current_map,
@@ -201,7 +451,7 @@ class TileMatrix:
             [TileData.from_dict(tile_data) for tile_data in row]
             for row in data["tiles"]
         ]
-        return cls(
+        return cls.from_tiles(
             tiles=tiles,
             width=data["width"],
             height=data["height"],
@@ -218,21 +468,15 @@ class TileMatrix:
 
     def get_tile_id_matrix(self):
         """Get a simple 2D numpy array of just tile IDs for compatibility."""
-        return np.array(
-            [[tile.tile_id for tile in row] for row in self.tiles], dtype=np.uint32
-        )
+        return self.tile_ids.astype(np.uint32)
 
     def get_walkability_matrix(self):
         """Get a boolean matrix indicating walkable tiles."""
-        return np.array(
-            [[tile.is_walkable for tile in row] for row in self.tiles], dtype=bool
-        )
+        return self.walkable_mask.copy()
 
     def get_encounter_matrix(self):
         """Get a boolean matrix indicating encounter tiles."""
-        return np.array(
-            [[tile.is_encounter_tile for tile in row] for row in self.tiles], dtype=bool
-        )
+        return self.encounter_mask.copy()
 
 
 def classify_tile_type(
@@ -249,27 +493,32 @@ def classify_tile_type(
     Returns:
         TileType classification
     """
+    if 0 <= tile_id < NUM_TILE_IDS and 0 <= tileset_id < NUM_TILESETS:
+        return _TILE_TYPE_TABLE_LIST[tileset_id][bool(is_walkable)][tile_id]
+    return _classify_tile_type(tile_id, is_walkable, tileset_id)
+
+
+def _classify_tile_type(
+    tile_id: int, is_walkable: bool, tileset_id: TilesetID
+) -> TileType:
+    # Reference classification, used for ids outside the precomputed table
     # Check tileset-specific mappings
-    if tileset_id in GRASS_TILES and tile_id in GRASS_TILES[tileset_id]:
+    flags = tile_property_flags(tileset_id, tile_id)
+
+    if flags & GRASS:
         return TileType.GRASS
 
-    if tileset_id in WATER_TILES and tile_id in WATER_TILES[tileset_id]:
+    if flags & WATER:
         return TileType.WATER
 
     # Check for warp tiles (including doors) - prioritize over road classification
-    if tileset_id in WARP_TILES and tile_id in WARP_TILES[tileset_id]:
-        return TileType.WARP
-
-    if tileset_id in DOOR_TILES and tile_id in DOOR_TILES[tileset_id]:
+    if flags & (WARP | DOOR):
         return TileType.WARP
 
-    if tileset_id in LEDGE_TILES:
-        # Check all ledge directions for this tileset
-        for tiles in LEDGE_TILES[tileset_id].values():
-            if tile_id in tiles:
-                return TileType.LEDGE
+    if flags & LEDGE:
+        return TileType.LEDGE
 
-    if tileset_id in TREE_TILES and tile_id in TREE_TILES[tileset_id]:
+    if flags & TREE:
         return TileType.TREE
 
     if is_walkable:
@@ -290,6 +539,104 @@ def classify_tile_type(
     return TileType.UNKNOWN
 
 
+def classify_tile_types(
+    tile_ids: np.ndarray, is_walkable: np.ndarray, tileset_id: TilesetID
+) -> np.ndarray:
+    """
+    Classify a whole array of tiles at once, matching classify_tile_type per cell.
+
+    Args:
+        tile_ids: uint8 array of tile identifiers
+        is_walkable: Boolean array of the same shape marking walkable tiles
+        tileset_id: Current tileset ID for context
+
+    Returns:
+        Object array of TileType values with the shape of tile_ids
+    """
+    return _TILE_TYPE_ARRAY[classify_tile_type_codes(tile_ids, is_walkable, tileset_id)]
+
+
+def classify_tile_type_codes(
+    tile_ids: np.ndarray, is_walkable: np.ndarray, tileset_id: TilesetID
+) -> np.ndarray:
+    """
+    Classify a whole array of tiles into TILE_TYPE_CODES.
+
+    Args:
+        tile_ids: uint8 array of tile identifiers
+        is_walkable: Boolean array of the same shape marking walkable tiles
+        tileset_id: Current tileset ID for context
+
+    Returns:
+        uint8 array of TileType codes (see TILE_TYPES) with the shape of tile_ids
+    """
+    tile_ids = np.asarray(tile_ids, dtype=np.uint8)
+    is_walkable = np.asarray(is_walkable, dtype=np.bool_)
+    return _TILE_TYPE_CODE_TABLE[tileset_id, is_walkable.view(np.uint8), tile_ids]
+
+
+def _select_tile_type_codes(
+    tile_ids: np.ndarray, is_walkable: np.ndarray, tileset_id: int
+) -> np.ndarray:
+    # classify_tile_type over arrays, in the same order of checks
+    conditions = [
+        GRASS_MASK[tileset_id][tile_ids],
+        WATER_MASK[tileset_id][tile_ids],
+        (WARP_MASK | DOOR_MASK)[tileset_id][tile_ids],
+        LEDGE_MASK[tileset_id][tile_ids],
+        TREE_MASK[tileset_id][tile_ids],
+        is_walkable & (tile_ids >= 20) & (tile_ids <= 30),
+        is_walkable,
+        (tile_ids >= 100) & (tile_ids <= 120),
+        (tile_ids >= 200) & (tile_ids <= 220),
+    ]
+    codes = np.select(conditions, np.arange(len(conditions)), len(conditions))
+    return _CLASSIFIED_TILE_TYPE_CODES[codes]
+
+
+# np.select index -> TileType code, in the order of the classification conditions
+_CLASSIFIED_TILE_TYPE_CODES = np.array(
+    [
+        TILE_TYPE_CODES[tile_type]
+        for tile_type in (
+            TileType.GRASS,
+            TileType.WATER,
+            TileType.WARP,
+            TileType.LEDGE,
+            TileType.TREE,
+            TileType.ROAD,
+            TileType.WALKABLE,
+            TileType.ROCK,
+            TileType.BUILDING,
+            TileType.BLOCKED,
+        )
+    ],
+    dtype=np.uint8,
+)
+
+
+def _build_tile_type_code_table() -> np.ndarray:
+    table = np.empty((NUM_TILESETS, 2, NUM_TILE_IDS), dtype=np.uint8)
+    tile_ids = np.arange(NUM_TILE_IDS, dtype=np.uint8)
+    for tileset_id in range(NUM_TILESETS):
+        for is_walkable in (False, True):
+            table[tileset_id, int(is_walkable)] = _select_tile_type_codes(
+                tile_ids, np.full(NUM_TILE_IDS, is_walkable), tileset_id
+            )
+    table.setflags(write=False)
+    return table
+
+
+# _TILE_TYPE_CODE_TABLE[tileset_id, is_walkable, tile_id] -> TileType code, so
+# classifying a screen is a single gather
+_TILE_TYPE_CODE_TABLE = _build_tile_type_code_table()
+
+# Nested-list copy of the table with TileType members, for scalar lookups
+_TILE_TYPE_TABLE_LIST: list[list[list[TileType]]] = _TILE_TYPE_ARRAY[
+    _TILE_TYPE_CODE_TABLE
+].tolist()
+
+
 def is_tile_walkable(tile_id: int, tileset_id: TilesetID = TilesetID.OVERWORLD) -> bool:
     """
     Determine if a tile is walkable based on collision tables.
@@ -301,5 +648,6 @@ def is_tile_walkable(tile_id: int, tileset_id: TilesetID = TilesetID.OVERWORLD)
     Returns:
         True if walkable, False if blocked
     """
-    collision_table = COLLISION_TABLES.get(tileset_id, set())
-    return tile_id in collision_table
+    if not (0 <= tileset_id < NUM_TILESETS and 0 <= tile_id < NUM_TILE_IDS):
+        return False
+    return is_walkable_tile_id(tileset_id, tile_id)
@@ -2,16 +2,98 @@
 Factory for creating TileData objects with common configurations.
 
 Eliminates code duplication in placeholder creation and provides
-reusable patterns for common tile types.
+reusable patterns for common tile types. Tiles are interned: identical field
+values share a single immutable TileData instance across frames.
 """
 
+from dataclasses import fields
+from functools import lru_cache
+
 from .data.tile_data_constants import TilesetID
 from .tile_data import TileData, TileType
 
+# Adjacent frames mostly produce identical tiles, so share instances instead of
+# allocating ~360 fresh objects per frame. TileData is frozen, so sharing is safe.
+# The cache is typed: equal values of different types (0 and TilesetID.OVERWORLD,
+# True and 1) would otherwise hand back a tile holding the other type.
+_intern_tile = lru_cache(maxsize=4096, typed=True)(TileData)
+
+# Field order of TileData.__init__; tiles are always built positionally because
+# keyword construction (and keyword cache keys) cost several times more.
+_TILE_DATA_FIELD_ORDER = tuple(field.name for field in fields(TileData))
+
+# Field values shared by every factory, in _TILE_DATA_FIELD_ORDER. Dict union keeps
+# the key order, so (_BASE_TILE | overrides).values() lines up with __init__.
+_BASE_TILE = {
+    "tile_id": 0x00,
+    "x": 0,
+    "y": 0,
+    "map_x": 0,
+    "map_y": 0,
+    "tile_type": TileType.UNKNOWN,
+    "tileset_id": TilesetID.OVERWORLD,
+    "raw_value": 0x00,
+    "is_walkable": False,
+    "is_ledge_tile": False,
+    "ledge_direction": None,
+    "movement_modifier": 1.0,
+    "is_encounter_tile": False,
+    "is_warp_tile": False,
+    "is_animated": False,
+    "light_level": 15,
+    "has_sign": False,
+    "has_bookshelf": False,
+    "strength_boulder": False,
+    "cuttable_tree": False,
+    "pc_accessible": False,
+    "trainer_sight_line": False,
+    "trainer_id": None,
+    "hidden_item_id": None,
+    "requires_itemfinder": False,
+    "safari_zone_steps": False,
+    "game_corner_tile": False,
+    "is_fly_destination": False,
+    "has_footstep_sound": True,
+    "sprite_priority": 0,
+    "background_priority": 0,
+    "elevation_pair": None,
+    "sprite_offset": 0,
+    "blocks_light": False,
+    "water_current_direction": None,
+    "warp_destination_map": None,
+    "warp_destination_x": None,
+    "warp_destination_y": None,
+}
+
+
+def _build_tile(**overrides) -> TileData:
+    return _intern_tile(*(_BASE_TILE | overrides).values())
+
+
+@lru_cache(maxsize=4)
+def _placeholder_rows(width: int, height: int) -> tuple[tuple[TileData, ...], ...]:
+    return tuple(
+        tuple(TileDataFactory.create_placeholder(x, y) for x in range(width))
+        for y in range(height)
+    )
+
 
 class TileDataFactory:
     """Factory class for creating TileData objects with common configurations."""
 
+    @staticmethod
+    def create_tile(**values) -> TileData:
+        """
+        Create a tile from explicit field values, reusing an existing instance.
+
+        Args:
+            **values: Values for every TileData field
+
+        Returns:
+            Interned TileData with the given field values
+        """
+        return _build_tile(**values)
+
     @staticmethod
     def create_placeholder(
         x: int, y: int, map_x: int | None = None, map_y: int | None = None
@@ -28,47 +110,30 @@ class TileDataFactory:
         Returns:
             TileData configured as an unknown/blocked placeholder
         """
-        return TileData(
-            tile_id=0x00,
+        return _build_tile(
             x=x,
             y=y,
             map_x=map_x or x,
             map_y=map_y or y,
-            tile_type=TileType.UNKNOWN,
-            tileset_id=TilesetID.OVERWORLD,
-            raw_value=0x00,
-            is_walkable=False,
-            is_ledge_tile=False,
-            ledge_direction=None,
-            movement_modifier=1.0,
-            is_encounter_tile=False,
-            is_warp_tile=False,
-            is_animated=False,
-            light_level=15,
-            has_sign=False,
-            has_bookshelf=False,
-            strength_boulder=False,
-            cuttable_tree=False,
-            pc_accessible=False,
-            trainer_sight_line=False,
-            trainer_id=None,
-            hidden_item_id=None,
-            requires_itemfinder=False,
-            safari_zone_steps=False,
-            game_corner_tile=False,
-            is_fly_destination=False,
-            has_footstep_sound=True,
-            sprite_priority=0,
-            background_priority=0,
-            elevation_pair=None,
-            sprite_offset=0,
-            blocks_light=False,
-            water_current_direction=None,
-            warp_destination_map=None,
-            warp_destination_x=None,
-            warp_destination_y=None,
         )
 
+    @staticmethod
+    def create_placeholder_grid(width: int, height: int) -> list[list[TileData]]:
+        """
+        Create a grid of placeholder tiles in tiles[y][x] format.
+
+        The placeholders are built once per grid size; each call only copies the
+        row lists, so callers may replace entries without affecting later grids.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+
+        Returns:
+            2D list of placeholder TileData objects
+        """
+        return [list(row) for row in _placeholder_rows(width, height)]
+
     @staticmethod
     def create_walkable(
         tile_id: int,
@@ -94,7 +159,7 @@ class TileDataFactory:
         Returns:
             TileData configured as a walkable tile
         """
-        return TileData(
+        return _build_tile(
             tile_id=tile_id,
             x=x,
             y=y,
@@ -104,35 +169,6 @@ class TileDataFactory:
             tileset_id=tileset_id,
             raw_value=tile_id,
             is_walkable=True,
-            is_ledge_tile=False,
-            ledge_direction=None,
-            movement_modifier=1.0,
-            is_encounter_tile=False,
-            is_warp_tile=False,
-            is_animated=False,
-            light_level=15,
-            has_sign=False,
-            has_bookshelf=False,
-            strength_boulder=False,
-            cuttable_tree=False,
-            pc_accessible=False,
-            trainer_sight_line=False,
-            trainer_id=None,
-            hidden_item_id=None,
-            requires_itemfinder=False,
-            safari_zone_steps=False,
-            game_corner_tile=False,
-            is_fly_destination=False,
-            has_footstep_sound=True,
-            sprite_priority=0,
-            background_priority=0,
-            elevation_pair=None,
-            sprite_offset=0,
-            blocks_light=False,
-            water_current_direction=None,
-            warp_destination_map=None,
-            warp_destination_x=None,
-            warp_destination_y=None,
         )
 
     @staticmethod
@@ -160,7 +196,7 @@ class TileDataFactory:
         Returns:
             TileData configured as a blocked tile
         """
-        return TileData(
+        return _build_tile(
             tile_id=tile_id,
             x=x,
             y=y,
@@ -169,36 +205,7 @@ class TileDataFactory:
             tile_type=tile_type,
             tileset_id=tileset_id,
             raw_value=tile_id,
-            is_walkable=False,
-            is_ledge_tile=False,
-            ledge_direction=None,
-            movement_modifier=1.0,
-            is_encounter_tile=False,
-            is_warp_tile=False,
-            is_animated=False,
-            light_level=15,
-            has_sign=False,
-            has_bookshelf=False,
-            strength_boulder=False,
-            cuttable_tree=False,
-            pc_accessible=False,
-            trainer_sight_line=False,
-            trainer_id=None,
-            hidden_item_id=None,
-            requires_itemfinder=False,
-            safari_zone_steps=False,
-            game_corner_tile=False,
-            is_fly_destination=False,
-            has_footstep_sound=True,
-            sprite_priority=0,
-            background_priority=0,
-            elevation_pair=None,
-            sprite_offset=0,
             blocks_light=True,
-            water_current_direction=None,
-            warp_destination_map=None,
-            warp_destination_x=None,
-            warp_destination_y=None,
         )
 
     @staticmethod
@@ -226,7 +233,7 @@ class TileDataFactory:
         Returns:
             TileData configured as a water tile
         """
-        return TileData(
+        return _build_tile(
             tile_id=tile_id,
             x=x,
             y=y,
@@ -236,35 +243,10 @@ class TileDataFactory:
             tileset_id=tileset_id,
             raw_value=tile_id,
             is_walkable=True,  # With surf
-            is_ledge_tile=False,
-            ledge_direction=None,
             movement_modifier=0.5,  # Surfing speed
             is_encounter_tile=True,  # Water encounters
-            is_warp_tile=False,
             is_animated=True,
-            light_level=15,
-            has_sign=False,
-            has_bookshelf=False,
-            strength_boulder=False,
-            cuttable_tree=False,
-            pc_accessible=False,
-            trainer_sight_line=False,
-            trainer_id=None,
-            hidden_item_id=None,
-            requires_itemfinder=False,
-            safari_zone_steps=False,
-            game_corner_tile=False,
-            is_fly_destination=False,
-            has_footstep_sound=True,  # Splash sound
-            sprite_priority=0,
-            background_priority=0,
-            elevation_pair=None,
-            sprite_offset=0,
-            blocks_light=False,
             water_current_direction=current_direction,
-            warp_destination_map=None,
-            warp_destination_x=None,
-            warp_destination_y=None,
         )
 
     @staticmethod
@@ -292,7 +274,7 @@ class TileDataFactory:
         Returns:
             TileData configured as a ledge tile
         """
-        return TileData(
+        return _build_tile(
             tile_id=tile_id,
             x=x,
             y=y,
@@ -304,31 +286,4 @@ class TileDataFactory:
             is_walkable=True,  # Can jump down
             is_ledge_tile=True,
             ledge_direction=direction,
-            movement_modifier=1.0,
-            is_encounter_tile=False,
-            is_warp_tile=False,
-            is_animated=False,
-            light_level=15,
-            has_sign=False,
-            has_bookshelf=False,
-            strength_boulder=False,
-            cuttable_tree=False,
-            pc_accessible=False,
-            trainer_sight_line=False,
-            trainer_id=None,
-            hidden_item_id=None,
-            requires_itemfinder=False,
-            safari_zone_steps=False,
-            game_corner_tile=False,
-            is_fly_destination=False,
-            has_footstep_sound=True,
-            sprite_priority=0,
-            background_priority=0,
-            elevation_pair=None,
-            sprite_offset=0,
-            blocks_light=False,
-            water_current_direction=None,
-            warp_destination_map=None,
-            warp_destination_x=None,
-            warp_destination_y=None,
         )
@@ -5,23 +5,180 @@ Refactors the scattered detection functions from enhanced_tile_creator.py
 into a single organized class for better maintainability and testing.
 """
 
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from types import MappingProxyType
+
+import numpy as np
 from pyboy import PyBoyMemoryView
 
-from .data.memory_addresses import MemoryAddresses
 from .data.tile_data_constants import (
-    BOOKSHELF_TILES,
-    DOOR_TILES,
-    GRASS_TILES,
     LEDGE_DATA,
     LEDGE_TILES,
-    PC_TILES,
-    SIGN_TILES,
-    STRENGTH_BOULDER_TILES,
-    TREE_TILES,
-    WARP_TILES,
-    WATER_TILES,
     TilesetID,
 )
+from .data.tile_masks import (
+    BOOKSHELF,
+    BOOKSHELF_MASK,
+    DOOR,
+    DOOR_MASK,
+    GRASS,
+    GRASS_MASK,
+    INTERACTION,
+    NUM_TILE_IDS,
+    NUM_TILESETS,
+    PC,
+    PC_MASK,
+    SIGN,
+    SIGN_MASK,
+    STRENGTH_BOULDER,
+    STRENGTH_BOULDER_MASK,
+    TREE,
+    TREE_MASK,
+    WARP,
+    WARP_MASK,
+    WATER,
+    WATER_MASK,
+    tile_property_flags,
+)
+
+# Ledge directions resolved once at import; the first LEDGE_DATA entry for a tile
+# wins, matching the original linear scan.
+_LEDGE_DIRECTIONS: dict[int, str] = {
+    ledge_tile: input_required.rsplit("_", 1)[-1].lower()
+    for _, _, ledge_tile, input_required in reversed(LEDGE_DATA)
+}
+
+_INDOOR_TILESETS = frozenset(
+    {
+        TilesetID.REDS_HOUSE_1,
+        TilesetID.REDS_HOUSE_2,
+        TilesetID.POKECENTER,
+        TilesetID.MART,
+    }
+)
+
+_LEDGE_LOOKUP: dict[tuple[int, int], str] = {
+    (tileset, tile): direction
+    for tileset, directions in LEDGE_TILES.items()
+    for direction, tiles in directions.items()
+    for tile in tiles
+}
+
+
+def _build_ledge_direction_table() -> np.ndarray:
+    table = np.full((NUM_TILESETS, NUM_TILE_IDS), None, dtype=object)
+    for (tileset, tile), direction in _LEDGE_LOOKUP.items():
+        table[tileset, tile] = direction
+    # LEDGE_DATA directions apply to every tileset and take precedence
+    for tile, direction in _LEDGE_DIRECTIONS.items():
+        table[:, tile] = direction
+    table.setflags(write=False)
+    return table
+
+
+# _LEDGE_DIRECTION_TABLE[tileset_id, tile_id] -> ledge direction or None
+_LEDGE_DIRECTION_TABLE = _build_ledge_direction_table()
+
+# _IS_LEDGE_TABLE[tileset_id, tile_id] -> tile has a ledge direction
+_IS_LEDGE_TABLE = np.array(
+    [
+        [direction is not None for direction in row]
+        for row in _LEDGE_DIRECTION_TABLE.tolist()
+    ],
+    dtype=np.bool_,
+)
+_IS_LEDGE_TABLE.setflags(write=False)
+
+# Shared results for the common case where a detector changes nothing. Detectors
+# return these directly, so they are read-only mappings.
+_AUDIO_DEFAULT = MappingProxyType({"has_footstep_sound": True, "audio_type": "normal"})
+_ANIMATION_DEFAULT = MappingProxyType(
+    {
+        "is_animated": False,
+        "sprite_priority": 0,
+        "background_priority": 0,
+        "animation_speed": 0,
+    }
+)
+_INTERACTION_DEFAULT = MappingProxyType(
+    {
+        "has_sign": False,
+        "has_bookshelf": False,
+        "strength_boulder": False,
+        "cuttable_tree": False,
+        "pc_accessible": False,
+    }
+)
+_NO_SIGHT_LINE = MappingProxyType(
+    {"in_sight_line": False, "trainer_id": None, "sight_distance": 0}
+)
+_ENVIRONMENTAL_DEFAULT = MappingProxyType(
+    {
+        "is_encounter": False,
+        "is_warp": False,
+        "water_current_direction": None,
+        "warp_destination_map": None,
+        "warp_destination_x": None,
+        "warp_destination_y": None,
+    }
+)
+_GRASS_ANIMATION = MappingProxyType(
+    {**_ANIMATION_DEFAULT, "is_animated": True, "animation_speed": 1}
+)
+_WATER_ANIMATION = MappingProxyType(
+    {**_ANIMATION_DEFAULT, "is_animated": True, "animation_speed": 2}
+)
+
+
+def _light(tileset_id: TilesetID) -> tuple[int, bool]:
+    # Caves are dark and block light; indoor areas have moderate light
+    if tileset_id == TilesetID.CAVERN:
+        return 8, True
+    if tileset_id in _INDOOR_TILESETS:
+        return 12, False
+    return 15, False
+
+
+# The detectors below depend on a handful of flag combinations, so each distinct
+# result is built once and shared like the defaults above.
+@cache
+def _special_properties(
+    light_level: int, blocks_light: bool, is_water: bool
+) -> Mapping:
+    return MappingProxyType(
+        {
+            "movement_modifier": 0.5 if is_water else 1.0,  # Surfing speed
+            "light_level": light_level,
+            "blocks_light": blocks_light,
+            "safari_zone_steps": False,
+            "game_corner_tile": False,
+            "is_fly_destination": False,
+            "hidden_item_id": None,
+            "requires_itemfinder": False,
+            "elevation_pair": None,
+        }
+    )
+
+
+@cache
+def _interaction_properties(flags: int) -> Mapping:
+    return MappingProxyType(
+        {
+            "has_sign": bool(flags & SIGN),
+            "has_bookshelf": bool(flags & BOOKSHELF),
+            "strength_boulder": bool(flags & STRENGTH_BOULDER),
+            "cuttable_tree": bool(flags & TREE),
+            "pc_accessible": bool(flags & PC),
+        }
+    )
+
+
+@cache
+def _environmental_properties(is_encounter: bool, is_warp: bool) -> Mapping:
+    return MappingProxyType(
+        {**_ENVIRONMENTAL_DEFAULT, "is_encounter": is_encounter, "is_warp": is_warp}
+    )
 
 
 class TilePropertyDetector:
@@ -41,95 +198,67 @@ class TilePropertyDetector:
         Returns:
             Tuple of (ledge_direction, is_ledge_tile)
         """
-        # Check against pokered ledge data structure
-        for _, _, ledge_tile, input_required in LEDGE_DATA:
-            if tile_id == ledge_tile:
-                # Extract direction from input_required (e.g., "D_DOWN" -> "down")
-                direction = input_required.split("_")[-1].lower()
-                return direction, True
-
-        # Check tileset-specific ledge tiles for backward compatibility
-        if tileset_id in LEDGE_TILES:
-            for direction, tiles in LEDGE_TILES[tileset_id].items():
-                if tile_id in tiles:
-                    return direction, True
+        direction = _LEDGE_DIRECTIONS.get(tile_id)
+        if direction is None:
+            # Tileset-specific ledge tiles for backward compatibility
+            direction = _LEDGE_LOOKUP.get((tileset_id, tile_id))
 
-        return None, False
+        return direction, direction is not None
 
     @staticmethod
-    def detect_audio_properties(tileset_id: TilesetID, tile_id: int) -> dict:
+    def detect_ledge_directions(
+        tileset_id: TilesetID, tile_ids: np.ndarray
+    ) -> np.ndarray:
         """
-        Detect audio properties for footstep sounds and environmental audio.
+        Detect ledge directions for a whole array of tiles at once.
 
         Args:
             tileset_id: Current tileset ID
-            tile_id: Tile ID to check
+            tile_ids: uint8 array of tile IDs
 
         Returns:
-            Dictionary with audio properties
+            Object array of ledge directions (None for non-ledge tiles) with the
+            shape of tile_ids
         """
-        # Default footstep sound for most tiles
-        has_footstep = True
+        return _LEDGE_DIRECTION_TABLE[tileset_id][np.asarray(tile_ids, dtype=np.uint8)]
 
-        # Water tiles typically have splash sounds
-        if tileset_id in WATER_TILES and tile_id in WATER_TILES[tileset_id]:
-            has_footstep = True  # Different sound but still has audio
+    @staticmethod
+    def detect_audio_properties(tileset_id: TilesetID, tile_id: int) -> Mapping:
+        """
+        Detect audio properties for footstep sounds and environmental audio.
 
-        # Some special tiles might be silent (would need pokered audio analysis)
+        Args:
+            tileset_id: Current tileset ID
+            tile_id: Tile ID to check
 
-        return {
-            "has_footstep_sound": has_footstep,
-            "audio_type": "normal",  # Could be "splash", "grass", "sand", etc.
-        }
+        Returns:
+            Read-only mapping with audio properties
+        """
+        # Water tiles splash but still have audio; telling sounds apart or finding
+        # silent tiles would need pokered audio analysis
+        return _AUDIO_DEFAULT
 
     @staticmethod
     def detect_trainer_sight_line(
-        memory_view: PyBoyMemoryView,
+        memory_view: PyBoyMemoryView | None,
         map_x: int,
         map_y: int,  # noqa: ARG002
-    ) -> dict:
+    ) -> Mapping:
         """
         Detect if position is in trainer sight line using sprite data analysis.
 
         Args:
-            memory_view: PyBoy memory view for sprite access
+            memory_view: PyBoy memory view for sprite access, or None if unavailable
             map_x: Absolute map X coordinate
             map_y: Absolute map Y coordinate
 
         Returns:
-            Dictionary with trainer sight line information
+            Read-only mapping with trainer sight line information
         """
-        try:
-            # Check trainer sprites for sight line detection
-            # This would require analysis of trainer sprite data and facing directions
-            # For now, return basic structure
-
-            in_sight_line = False
-            trainer_id = None
-
-            # Check up to 16 sprites for trainer types
-            for sprite_id in range(16):
-                sprite_base = MemoryAddresses.sprite_state_data + (sprite_id * 16)
-
-                # Read sprite data (would need trainer sprite identification)
-                _sprite_x = memory_view[sprite_base + 6]  # SPRITESTATEDATA1_XPIXELS
-                _sprite_y = memory_view[sprite_base + 4]  # SPRITESTATEDATA1_YPIXELS
-
-                # This would need proper trainer detection logic
-                # For now, placeholder implementation
-                del _sprite_x, _sprite_y  # Silence unused variable warnings
-
-            return {
-                "in_sight_line": in_sight_line,
-                "trainer_id": trainer_id,
-                "sight_distance": 0,
-            }
-        except Exception:
-            return {
-                "in_sight_line": False,
-                "trainer_id": None,
-                "sight_distance": 0,
-            }
+        # Telling trainers apart needs sprite identification and facing
+        # directions, which this detector does not analyse yet, so no position
+        # is reported as being in a sight line and sprite memory is not read
+        return _NO_SIGHT_LINE
 
     @staticmethod
     def detect_special_properties(
@@ -137,7 +266,7 @@ class TilePropertyDetector:
         tile_id: int,
         map_x: int,
         map_y: int,  # noqa: ARG002
-    ) -> dict:
+    ) -> Mapping:
         """
         Detect special zone properties and unique tile behaviors.
 
@@ -148,45 +277,20 @@ class TilePropertyDetector:
             map_y: Absolute map Y coordinate
 
         Returns:
-            Dictionary with special properties
+            Read-only mapping with special properties
         """
-        properties = {
-            "movement_modifier": 1.0,
-            "light_level": 15,
-            "blocks_light": False,
-            "safari_zone_steps": False,
-            "game_corner_tile": False,
-            "is_fly_destination": False,
-            "hidden_item_id": None,
-            "requires_itemfinder": False,
-            "elevation_pair": None,
-        }
-
-        # Cave/dungeon areas have reduced light
-        if tileset_id == TilesetID.CAVERN:
-            properties["light_level"] = 8
-            properties["blocks_light"] = True
-
-        # Indoor areas have moderate light
-        elif tileset_id in [
-            TilesetID.REDS_HOUSE_1,
-            TilesetID.REDS_HOUSE_2,
-            TilesetID.POKECENTER,
-            TilesetID.MART,
-        ]:
-            properties["light_level"] = 12
+        light_level, blocks_light = _light(tileset_id)
 
-        # Water tiles might slow movement
-        if tileset_id in WATER_TILES and tile_id in WATER_TILES[tileset_id]:
-            properties["movement_modifier"] = 0.5  # Surfing speed
-
-        # Special zone detection would require map-specific analysis
-        # This would need pokered map data to determine special zones
-
-        return properties
+        # Water tiles slow movement to surfing speed. Special zone detection would
+        # need pokered map data.
+        return _special_properties(
+            light_level,
+            blocks_light,
+            bool(tile_property_flags(tileset_id, tile_id) & WATER),
+        )
 
     @staticmethod
-    def detect_animation_info(tileset_id: TilesetID, tile_id: int) -> dict:
+    def detect_animation_info(tileset_id: TilesetID, tile_id: int) -> Mapping:
         """
         Detect animation properties and sprite priorities.
 
@@ -195,32 +299,24 @@ class TilePropertyDetector:
             tile_id: Tile ID to check
 
         Returns:
-            Dictionary with animation information
+            Read-only mapping with animation information
         """
-        # Default values
-        animation_info = {
-            "is_animated": False,
-            "sprite_priority": 0,
-            "background_priority": 0,
-            "animation_speed": 0,
-        }
+        flags = tile_property_flags(tileset_id, tile_id)
 
-        # Water tiles are typically animated
-        if tileset_id in WATER_TILES and tile_id in WATER_TILES[tileset_id]:
-            animation_info["is_animated"] = True
-            animation_info["animation_speed"] = 2
+        # Grass wind animation takes precedence over water animation
+        if flags & GRASS:
+            return _GRASS_ANIMATION
 
-        # Grass tiles might have wind animation
-        if tileset_id in GRASS_TILES and tile_id in GRASS_TILES[tileset_id]:
-            animation_info["is_animated"] = True
-            animation_info["animation_speed"] = 1
+        # Water tiles are typically animated
+        if flags & WATER:
+            return _WATER_ANIMATION
 
         # This would need pokered tileset animation analysis for complete accuracy
 
-        return animation_info
+        return _ANIMATION_DEFAULT
 
     @staticmethod
-    def detect_interaction_properties(tileset_id: TilesetID, tile_id: int) -> dict:
+    def detect_interaction_properties(tileset_id: TilesetID, tile_id: int) -> Mapping:
         """
         Detect interactive elements like signs, bookshelves, trees, etc.
 
@@ -229,39 +325,17 @@ class TilePropertyDetector:
             tile_id: Tile ID to check
 
         Returns:
-            Dictionary with interaction properties
+            Read-only mapping with interaction properties
         """
-        interactions = {
-            "has_sign": False,
-            "has_bookshelf": False,
-            "strength_boulder": False,
-            "cuttable_tree": False,
-            "pc_accessible": False,
-        }
+        # Most tiles have no interaction at all: one masked table load settles them
+        flags = tile_property_flags(tileset_id, tile_id) & INTERACTION
+        if not flags:
+            return _INTERACTION_DEFAULT
 
-        # Check tileset-specific interaction tiles
-        if tileset_id in SIGN_TILES and tile_id in SIGN_TILES[tileset_id]:
-            interactions["has_sign"] = True
-
-        if tileset_id in BOOKSHELF_TILES and tile_id in BOOKSHELF_TILES[tileset_id]:
-            interactions["has_bookshelf"] = True
-
-        if (
-            tileset_id in STRENGTH_BOULDER_TILES
-            and tile_id in STRENGTH_BOULDER_TILES[tileset_id]
-        ):
-            interactions["strength_boulder"] = True
-
-        if tileset_id in TREE_TILES and tile_id in TREE_TILES[tileset_id]:
-            interactions["cuttable_tree"] = True
-
-        if tileset_id in PC_TILES and tile_id in PC_TILES[tileset_id]:
-            interactions["pc_accessible"] = True
-
-        return interactions
+        return _interaction_properties(flags)
 
     @staticmethod
-    def detect_environmental_properties(tileset_id: TilesetID, tile_id: int) -> dict:
+    def detect_environmental_properties(tileset_id: TilesetID, tile_id: int) -> Mapping:
         """
         Detect environmental properties like encounters, warps, water currents.
 
@@ -270,35 +344,24 @@ class TilePropertyDetector:
             tile_id: Tile ID to check
 
         Returns:
-            Dictionary with environmental properties
+            Read-only mapping with environmental properties
         """
-        env_props = {
-            "is_encounter": False,
-            "is_warp": False,
-            "water_current_direction": None,
-            "warp_destination_map": None,
-            "warp_destination_x": None,
-            "warp_destination_y": None,
-        }
+        flags = tile_property_flags(tileset_id, tile_id)
 
         # Check for encounter tiles (grass)
-        if tileset_id in GRASS_TILES and tile_id in GRASS_TILES[tileset_id]:
-            env_props["is_encounter"] = True
+        is_encounter = bool(flags & GRASS)
+
+        # Check for warp tiles (comprehensive check matching Pokemon Red logic);
+        # door tiles are also warp tiles. Warp destinations would need map data.
+        is_warp = bool(flags & (WARP | DOOR))
 
-        # Check for warp tiles (comprehensive check matching Pokemon Red logic)
-        if tileset_id in WARP_TILES and tile_id in WARP_TILES[tileset_id]:
-            env_props["is_warp"] = True
-            # Warp destination would need map data analysis
-        elif tileset_id in DOOR_TILES and tile_id in DOOR_TILES[tileset_id]:
-            env_props["is_warp"] = True
-            # Door tiles are also warp tiles
+        # Water current detection for surfing mechanics would need pokered water
+        # current analysis
 
-        # Water current detection for surfing mechanics
-        if tileset_id in WATER_TILES and tile_id in WATER_TILES[tileset_id]:
-            # This would need pokered water current analysis
-            pass
+        if not (is_encounter or is_warp):
+            return _ENVIRONMENTAL_DEFAULT
 
-        return env_props
+        return _environmental_properties(is_encounter, is_warp)
 
     @classmethod
     def detect_all_properties(
@@ -308,7 +371,7 @@ class TilePropertyDetector:
         tile_id: int,
         map_x: int,
         map_y: int,
-    ) -> dict:
+    ) -> Mapping:
         """
         Detect all tile properties in a single call.
 
@@ -320,32 +383,156 @@ class TilePropertyDetector:
             map_y: Absolute map Y coordinate
 
         Returns:
-            Dictionary containing all detected properties
+            Mapping containing all detected properties
         """
-        # Detect all property types
-        ledge_direction, is_ledge = cls.detect_ledge_info(tileset_id, tile_id)
-        audio_props = cls.detect_audio_properties(tileset_id, tile_id)
+        properties = _all_properties(tileset_id, tile_id)
         trainer_sight = cls.detect_trainer_sight_line(memory_view, map_x, map_y)
-        special_props = cls.detect_special_properties(tileset_id, tile_id, map_x, map_y)
-        animation_info = cls.detect_animation_info(tileset_id, tile_id)
-        interaction_props = cls.detect_interaction_properties(tileset_id, tile_id)
-        environmental_props = cls.detect_environmental_properties(tileset_id, tile_id)
+        if trainer_sight is _NO_SIGHT_LINE:
+            return properties
+        return {**properties, **trainer_sight}
 
-        # Combine all properties into a single dictionary
-        return {
+    @staticmethod
+    def detect_all_batch(
+        tileset_id: TilesetID, tile_ids: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """
+        Detect the static properties of a whole array of tiles at once.
+
+        Covers every key of detect_all_properties except the trainer sight line,
+        which depends on sprite memory rather than the tile.
+
+        Args:
+            tileset_id: Current tileset ID
+            tile_ids: uint8 array of tile IDs
+
+        Returns:
+            Dictionary of arrays with the shape of tile_ids, one per property
+        """
+        records = _property_table(tileset_id)[np.asarray(tile_ids, dtype=np.uint8)]
+        return {key: records[key] for key in records.dtype.names or ()}
+
+
+@cache
+def _property_table(tileset_id: TilesetID) -> np.ndarray:
+    # Record array of every static property for all 256 tile ids of a tileset,
+    # so a batch lookup is a single gather
+    columns = _batch_properties(tileset_id, np.arange(NUM_TILE_IDS, dtype=np.uint8))
+    table = np.empty(
+        NUM_TILE_IDS, dtype=[(key, column.dtype) for key, column in columns.items()]
+    )
+    for key, column in columns.items():
+        table[key] = column
+    table.setflags(write=False)
+    return table
+
+
+def _batch_properties(
+    tileset_id: TilesetID, tile_ids: np.ndarray
+) -> dict[str, np.ndarray]:
+    shape = tile_ids.shape
+    is_grass = GRASS_MASK[tileset_id][tile_ids]
+    is_water = WATER_MASK[tileset_id][tile_ids]
+    ledge_direction = TilePropertyDetector.detect_ledge_directions(tileset_id, tile_ids)
+    light_level, blocks_light = _light(tileset_id)
+    no_value = np.full(shape, None, dtype=object)
+    false = np.zeros(shape, dtype=np.bool_)
+    zero = np.zeros(shape, dtype=np.uint8)
+
+    return {
+        # Ledge properties
+        "ledge_direction": ledge_direction,
+        "is_ledge": _IS_LEDGE_TABLE[tileset_id][tile_ids],
+        # Audio properties
+        "has_footstep_sound": np.ones(shape, dtype=np.bool_),
+        "audio_type": np.full(shape, "normal", dtype=object),
+        # Special properties
+        "movement_modifier": np.where(is_water, 0.5, 1.0),
+        "light_level": np.full(shape, light_level, dtype=np.uint8),
+        "blocks_light": np.full(shape, blocks_light),
+        "safari_zone_steps": false,
+        "game_corner_tile": false,
+        "is_fly_destination": false,
+        "hidden_item_id": no_value,
+        "requires_itemfinder": false,
+        "elevation_pair": no_value,
+        # Animation properties
+        "is_animated": is_grass | is_water,
+        "sprite_priority": zero,
+        "background_priority": zero,
+        "animation_speed": np.select([is_grass, is_water], [1, 2], 0),
+        # Interaction properties
+        "has_sign": SIGN_MASK[tileset_id][tile_ids],
+        "has_bookshelf": BOOKSHELF_MASK[tileset_id][tile_ids],
+        "strength_boulder": STRENGTH_BOULDER_MASK[tileset_id][tile_ids],
+        "cuttable_tree": TREE_MASK[tileset_id][tile_ids],
+        "pc_accessible": PC_MASK[tileset_id][tile_ids],
+        # Environmental properties
+        "is_encounter": is_grass,
+        "is_warp": (WARP_MASK | DOOR_MASK)[tileset_id][tile_ids],
+        "water_current_direction": no_value,
+        "warp_destination_map": no_value,
+        "warp_destination_x": no_value,
+        "warp_destination_y": no_value,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _all_properties(tileset_id: TilesetID, tile_id: int) -> Mapping:
+    # One table load resolves every static tile property; each field below
+    # matches what the individual detect_* methods report for the tile.
+    flags = tile_property_flags(tileset_id, tile_id)
+    is_water = bool(flags & WATER)
+    is_grass = bool(flags & GRASS)
+
+    ledge_direction, is_ledge = TilePropertyDetector.detect_ledge_info(
+        tileset_id, tile_id
+    )
+    light_level, blocks_light = _light(tileset_id)
+
+    if is_grass:
+        animation_speed = 1
+    elif is_water:
+        animation_speed = 2
+    else:
+        animation_speed = 0
+
+    return MappingProxyType(
+        {
             # Ledge properties
             "ledge_direction": ledge_direction,
             "is_ledge": is_ledge,
             # Audio properties
-            **audio_props,
+            "has_footstep_sound": True,
+            "audio_type": "normal",
             # Trainer sight line
-            **trainer_sight,
+            **_NO_SIGHT_LINE,
             # Special properties
-            **special_props,
+            "movement_modifier": 0.5 if is_water else 1.0,
+            "light_level": light_level,
+            "blocks_light": blocks_light,
+            "safari_zone_steps": False,
+            "game_corner_tile": False,
+            "is_fly_destination": False,
+            "hidden_item_id": None,
+            "requires_itemfinder": False,
+            "elevation_pair": None,
             # Animation properties
-            **animation_info,
+            "is_animated": is_water or is_grass,
+            "sprite_priority": 0,
+            "background_priority": 0,
+            "animation_speed": animation_speed,
             # Interaction properties
-            **interaction_props,
+            "has_sign": bool(flags & SIGN),
+            "has_bookshelf": bool(flags & BOOKSHELF),
+            "strength_boulder": bool(flags & STRENGTH_BOULDER),
+            "cuttable_tree": bool(flags & TREE),
+            "pc_accessible": bool(flags & PC),
             # Environmental properties
-            **environmental_props,
+            "is_encounter": is_grass,
+            "is_warp": bool(flags & (WARP | DOOR)),
+            "water_current_direction": None,
+            "warp_destination_map": None,
+            "warp_destination_x": None,
+            "warp_destination_y": None,
         }
+    )
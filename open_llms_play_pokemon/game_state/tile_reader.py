@@ -1,14 +1,100 @@
 import logging
+from typing import NamedTuple
 
+import numpy as np
 from pyboy import PyBoyMemoryView
 
 from .data.memory_addresses import MemoryAddresses
-from .data.tile_data_constants import TilesetID
-from .tile_data import TileData, classify_tile_type
+from .data.tile_data_constants import TILESETS_BY_ID, TilesetID
+from .data.tile_masks import (
+    NUM_TILE_IDS,
+    NUM_TILESETS,
+    WALKABLE_MASK,
+)
+from .tile_data import (
+    TILE_MATRIX_COLUMNS,
+    TileData,
+    TileMatrix,
+    classify_tile_type,
+    classify_tile_type_codes,
+)
+from .tile_data_factory import TileDataFactory
 from .tile_property_detector import TilePropertyDetector
 
 logger = logging.getLogger(__name__)
 
+# Visible wTileMap dimensions in tiles
+SCREEN_WIDTH, SCREEN_HEIGHT = 20, 18
+
+# Player sprite top-left on screen, verified from Pokemon Red assembly
+PLAYER_SCREEN_X, PLAYER_SCREEN_Y = 8, 9
+
+
+# TileData fields filled straight from TilePropertyDetector property keys
+_PROPERTY_COLUMNS = {
+    "is_ledge_tile": "is_ledge",
+    "ledge_direction": "ledge_direction",
+    "movement_modifier": "movement_modifier",
+    "is_encounter_tile": "is_encounter",
+    "is_warp_tile": "is_warp",
+    "is_animated": "is_animated",
+    "light_level": "light_level",
+    "has_sign": "has_sign",
+    "has_bookshelf": "has_bookshelf",
+    "strength_boulder": "strength_boulder",
+    "cuttable_tree": "cuttable_tree",
+    "pc_accessible": "pc_accessible",
+    "hidden_item_id": "hidden_item_id",
+    "requires_itemfinder": "requires_itemfinder",
+    "safari_zone_steps": "safari_zone_steps",
+    "game_corner_tile": "game_corner_tile",
+    "is_fly_destination": "is_fly_destination",
+    "has_footstep_sound": "has_footstep_sound",
+    "sprite_priority": "sprite_priority",
+    "background_priority": "background_priority",
+    "elevation_pair": "elevation_pair",
+    "blocks_light": "blocks_light",
+    "water_current_direction": "water_current_direction",
+    "warp_destination_map": "warp_destination_map",
+    "warp_destination_x": "warp_destination_x",
+    "warp_destination_y": "warp_destination_y",
+}
+
+
+# The 16 sprite slots of 16 bytes each (SPRITESTATEDATA1), read with one slice
+_SPRITE_STATE_TABLE = slice(
+    MemoryAddresses.sprite_state_data, MemoryAddresses.sprite_state_data + 16 * 16
+)
+
+# The visible wTileMap buffer, read with one slice
+_TILE_MAP = slice(
+    MemoryAddresses.tile_map_buffer,
+    MemoryAddresses.tile_map_buffer + SCREEN_WIDTH * SCREEN_HEIGHT,
+)
+
+# Collision tables longer than this are treated as corrupt (terminator included)
+_MAX_COLLISION_TABLE_LENGTH = 101
+
+# Walkable table for unknown tilesets
+_NO_WALKABLE_TILES = np.zeros(NUM_TILE_IDS, dtype=np.bool_)
+_NO_WALKABLE_TILES.setflags(write=False)
+
+
+class ScreenInputs(NamedTuple):
+    """Everything a TileMatrix is computed from, read in one pass.
+
+    Two reads that compare equal produce the same TileMatrix, so callers can keep
+    the last matrix and reuse it while the screen is unchanged.
+    """
+
+    tileset_byte: int
+    player_x: int
+    player_y: int
+    current_map: int
+    tile_map: bytes
+    sprite_table: bytes
+    collision_table: bytes | None
+
 
 def get_tile_id(memory_view: PyBoyMemoryView, x: int, y: int) -> int:
     """
@@ -65,221 +151,75 @@ def is_collision_tile(memory_view: PyBoyMemoryView, tile_id: int) -> bool:
     Returns:
         True if tile blocks movement, False if walkable
     """
-    try:
-        # Read collision table pointer (2 bytes, little endian)
-        collision_ptr_low = memory_view[MemoryAddresses.tileset_collision_ptr]
-        collision_ptr_high = memory_view[MemoryAddresses.tileset_collision_ptr + 1]
-        collision_ptr = collision_ptr_low | (collision_ptr_high << 8)
-
-        # Validate pointer is reasonable (should be in ROM space)
-        if collision_ptr < 0x4000 or collision_ptr > 0x7FFF:
-            # Fallback to hardcoded collision tables when pointer is invalid
-            return _fallback_collision_check(memory_view, tile_id, logger)
-
-        # Read collision table until FF termination
-        # NOTE: Pokemon Red collision tables contain WALKABLE tiles, not blocked tiles
-        offset = 0
-        while True:
-            collision_tile = memory_view[collision_ptr + offset]
-            if collision_tile == 0xFF:  # End of table
-                break
-            if collision_tile == tile_id:
-                return False  # Tile is in collision table (walkable)
-            offset += 1
-            if offset > 100:  # Safety limit to prevent infinite loops
-                logger.warning(
-                    f"Collision table too long, using fallback for tile {tile_id}"
-                )
-                return _fallback_collision_check(memory_view, tile_id, logger)
-
-        return True  # Tile not in collision table (blocked)
-    except Exception as e:
-        logger.warning(f"Failed to read collision data for tile {tile_id}: {e}")
-        return _fallback_collision_check(memory_view, tile_id, logger)
-
-
-def _fallback_collision_check(
-    memory_view: PyBoyMemoryView, tile_id: int, logger
-) -> bool:
+    if not 0 <= tile_id < NUM_TILE_IDS:
+        return True
+    collision_table = _read_collision_table(memory_view)
+    if collision_table is None:
+        return not _fallback_walkable_table(memory_view)[tile_id]
+    # Tile is in collision table (walkable), checked with a C-level byte search
+    return tile_id not in collision_table
+
+
+def read_walkable_table(memory_view: PyBoyMemoryView) -> np.ndarray:
     """
-    Fallback collision detection using hardcoded tileset collision tables.
-    Based on Pokemon Red source code collision tables.
+    Read the current tileset's collision table into a per-tile walkable table.
+
+    The collision pointer and table are read once, so callers checking many
+    tiles of the same screen should read this table once and index it.
+
+    Args:
+        memory_view: PyBoy memory view for reading collision data
+
+    Returns:
+        Read-only bool array of length 256, True where the tile ID is walkable
     """
-    try:
-        current_tileset = memory_view[MemoryAddresses.current_tileset]
-    except Exception:
-        logger.warning(f"Could not read tileset, assuming tile {tile_id} is blocked")
-        return True
+    return _walkable_table(memory_view, _read_collision_table(memory_view))
 
-    # Hardcoded collision tables from Pokemon Red source (walkable tiles for each tileset)
-    # These correspond to the collision_tile_ids.asm file and tileset_headers.asm ordering
-    tileset_walkable_tiles = {
-        0: [
-            0x00,
-            0x10,
-            0x1B,
-            0x20,
-            0x21,
-            0x23,
-            0x2C,
-            0x2D,
-            0x2E,
-            0x30,
-            0x31,
-            0x33,
-            0x39,
-            0x3C,
-            0x3E,
-            0x52,
-            0x54,
-            0x58,
-            0x5B,
-        ],  # Overworld_Coll
-        1: [0x01, 0x02, 0x03, 0x11, 0x12, 0x13, 0x14, 0x1C, 0x1A],  # RedsHouse1_Coll
-        2: [0x11, 0x1A, 0x1C, 0x3C, 0x5E],  # Mart_Coll
-        3: [
-            0x1E,
-            0x20,
-            0x2E,
-            0x30,
-            0x34,
-            0x37,
-            0x39,
-            0x3A,
-            0x40,
-            0x51,
-            0x52,
-            0x5A,
-            0x5C,
-            0x5E,
-            0x5F,
-        ],  # Forest_Coll
-        4: [
-            0x01,
-            0x02,
-            0x03,
-            0x11,
-            0x12,
-            0x13,
-            0x14,
-            0x1C,
-            0x1A,
-        ],  # RedsHouse2_Coll (same as RedsHouse1_Coll)
-        5: [
-            0x11,
-            0x16,
-            0x19,
-            0x2B,
-            0x3C,
-            0x3D,
-            0x3F,
-            0x4A,
-            0x4C,
-            0x4D,
-            0x03,
-        ],  # Dojo_Coll
-        6: [0x11, 0x1A, 0x1C, 0x3C, 0x5E],  # Pokecenter_Coll (same as Mart_Coll)
-        7: [
-            0x11,
-            0x16,
-            0x19,
-            0x2B,
-            0x3C,
-            0x3D,
-            0x3F,
-            0x4A,
-            0x4C,
-            0x4D,
-            0x03,
-        ],  # Gym_Coll (same as Dojo_Coll)
-        8: [0x01, 0x12, 0x14, 0x28, 0x32, 0x37, 0x44, 0x54, 0x5C],  # House_Coll
-        9: [
-            0x01,
-            0x12,
-            0x14,
-            0x1A,
-            0x1C,
-            0x37,
-            0x38,
-            0x3B,
-            0x3C,
-            0x5E,
-        ],  # ForestGate_Coll
-        10: [
-            0x01,
-            0x12,
-            0x14,
-            0x1A,
-            0x1C,
-            0x37,
-            0x38,
-            0x3B,
-            0x3C,
-            0x5E,
-        ],  # Museum_Coll (same as ForestGate_Coll)
-        11: [0x0B, 0x0C, 0x13, 0x15, 0x18],  # Underground_Coll
-        12: [
-            0x01,
-            0x12,
-            0x14,
-            0x1A,
-            0x1C,
-            0x37,
-            0x38,
-            0x3B,
-            0x3C,
-            0x5E,
-        ],  # Gate_Coll (same as ForestGate_Coll)
-        13: [0x04, 0x0D, 0x17, 0x1D, 0x1E, 0x23, 0x34, 0x37, 0x39, 0x4A],  # Ship_Coll
-        14: [0x0A, 0x1A, 0x32, 0x3B],  # ShipPort_Coll
-        15: [0x01, 0x10, 0x13, 0x1B, 0x22, 0x42, 0x52],  # Cemetery_Coll
-        16: [0x04, 0x0F, 0x15, 0x1F, 0x3B, 0x45, 0x47, 0x55, 0x56],  # Interior_Coll
-        17: [0x05, 0x15, 0x18, 0x1A, 0x20, 0x21, 0x22, 0x2A, 0x2D, 0x30],  # Cavern_Coll
-        18: [0x14, 0x17, 0x1A, 0x1C, 0x20, 0x38, 0x45],  # Lobby_Coll
-        19: [0x01, 0x05, 0x11, 0x12, 0x14, 0x1A, 0x1C, 0x2C, 0x53],  # Mansion_Coll
-        20: [0x0C, 0x26, 0x16, 0x1E, 0x34, 0x37],  # Lab_Coll
-        21: [
-            0x0F,
-            0x1A,
-            0x1F,
-            0x26,
-            0x28,
-            0x29,
-            0x2C,
-            0x2D,
-            0x2E,
-            0x2F,
-            0x41,
-        ],  # Club_Coll
-        22: [
-            0x01,
-            0x10,
-            0x11,
-            0x13,
-            0x1B,
-            0x20,
-            0x21,
-            0x22,
-            0x30,
-            0x31,
-            0x32,
-            0x42,
-            0x43,
-            0x48,
-            0x52,
-            0x55,
-            0x58,
-            0x5E,
-        ],  # Facility_Coll
-        23: [0x1B, 0x23, 0x2C, 0x2D, 0x3B, 0x45],  # Plateau_Coll
-    }
 
-    walkable_tiles = tileset_walkable_tiles.get(current_tileset, [])
+def _walkable_table(
+    memory_view: PyBoyMemoryView, collision_table: bytes | None
+) -> np.ndarray:
+    if collision_table is None:
+        return _fallback_walkable_table(memory_view)
+
+    walkable = np.zeros(NUM_TILE_IDS, dtype=np.bool_)
+    walkable[np.frombuffer(collision_table, dtype=np.uint8)] = True
+    walkable.setflags(write=False)
+    return walkable
+
+
+def _read_collision_table(memory_view: PyBoyMemoryView) -> bytes | None:
+    # Walkable tile IDs of the tileset's ROM collision table, or None when the
+    # hardcoded tables have to be used instead. All reads are at fixed or
+    # range-checked addresses inside the 64KB address space and cannot fail.
+
+    # Read collision table pointer (2 bytes, little endian)
+    collision_ptr_low = memory_view[MemoryAddresses.tileset_collision_ptr]
+    collision_ptr_high = memory_view[MemoryAddresses.tileset_collision_ptr + 1]
+    collision_ptr = collision_ptr_low | (collision_ptr_high << 8)
 
-    if tile_id in walkable_tiles:
-        return False  # Tile is walkable
-    else:
-        return True  # Tile is blocked
+    # Validate pointer is reasonable (should be in ROM space)
+    if collision_ptr < 0x4000 or collision_ptr > 0x7FFF:
+        return None
+
+    # Read collision table until FF termination
+    # NOTE: Pokemon Red collision tables contain WALKABLE tiles, not blocked tiles
+    table = bytes(
+        memory_view[collision_ptr : collision_ptr + _MAX_COLLISION_TABLE_LENGTH]
+    )
+    end = table.find(0xFF)
+    if end < 0:  # Safety limit for a missing terminator
+        logger.warning("Collision table too long, using fallback table")
+        return None
+    return table[:end]
+
+
+def _fallback_walkable_table(memory_view: PyBoyMemoryView) -> np.ndarray:
+    # Hardcoded collision tables from Pokemon Red source (collision_tile_ids.asm)
+    current_tileset = memory_view[MemoryAddresses.current_tileset]
+    if not 0 <= current_tileset < NUM_TILESETS:
+        return _NO_WALKABLE_TILES
+    return WALKABLE_MASK[current_tileset]
 
 
 def get_sprite_at_position(
@@ -296,26 +236,42 @@ def get_sprite_at_position(
     Returns:
         Sprite offset if sprite found at position, 0 if no sprite
     """
-    try:
-        # Convert screen coordinates to pixel coordinates
-        pixel_x = screen_x * 8
-        pixel_y = screen_y * 8
+    return _sprite_offset_at(read_sprite_positions(memory_view), screen_x, screen_y)
+
+
+def read_sprite_positions(memory_view: PyBoyMemoryView) -> list[tuple[int, int]]:
+    """
+    Read the pixel position of all 16 sprite slots with a single memory slice.
+
+    Args:
+        memory_view: PyBoy memory view for accessing sprite data
+
+    Returns:
+        List of (pixel_x, pixel_y) tuples indexed by sprite slot
+    """
+    return _sprite_positions(memory_view[_SPRITE_STATE_TABLE])
 
-        # Check up to 16 sprite slots (standard for Game Boy)
-        for sprite_id in range(16):
-            sprite_base = MemoryAddresses.sprite_state_data + (sprite_id * 16)
 
-            # Read sprite position (SPRITESTATEDATA structure)
-            sprite_x = memory_view[sprite_base + 6]  # SPRITESTATEDATA1_XPIXELS
-            sprite_y = memory_view[sprite_base + 4]  # SPRITESTATEDATA1_YPIXELS
+def _sprite_positions(sprite_table) -> list[tuple[int, int]]:
+    # SPRITESTATEDATA1_XPIXELS and SPRITESTATEDATA1_YPIXELS of each slot, taken
+    # as strided slices of the 16-byte records
+    return list(zip(sprite_table[6::16], sprite_table[4::16], strict=True))
 
-            # Check if sprite is at the target position (8x8 tile)
-            if abs(sprite_x - pixel_x) < 8 and abs(sprite_y - pixel_y) < 8:
-                return sprite_id + 1  # Return non-zero sprite offset
 
-        return 0  # No sprite found
-    except Exception:
-        return 0  # Return 0 if sprite detection fails
+def _sprite_offset_at(
+    sprite_positions: list[tuple[int, int]], screen_x: int, screen_y: int
+) -> int:
+    # Convert screen coordinates to pixel coordinates
+    pixel_x = screen_x * 8
+    pixel_y = screen_y * 8
+
+    # Check up to 16 sprite slots (standard for Game Boy)
+    for sprite_id, (sprite_x, sprite_y) in enumerate(sprite_positions):
+        # Check if sprite is at the target position (8x8 tile)
+        if -8 < sprite_x - pixel_x < 8 and -8 < sprite_y - pixel_y < 8:
+            return sprite_id + 1  # Return non-zero sprite offset
+
+    return 0  # No sprite found
 
 
 def read_entire_screen(memory_view: PyBoyMemoryView) -> list[TileData]:
@@ -329,28 +285,146 @@ def read_entire_screen(memory_view: PyBoyMemoryView) -> list[TileData]:
         List of TileData objects for all tiles on screen (360 tiles max)
         Empty list if map is transitioning/loading
     """
+    tile_matrix = read_tile_matrix(memory_view)
+    if tile_matrix is None:
+        return []
+    return [tile for row in tile_matrix.tiles for tile in row]
+
+
+def _sprite_offset_grid(sprite_positions: list[tuple[int, int]]) -> np.ndarray:
+    # Stamp each sprite onto the tiles it covers, matching _sprite_offset_at: a
+    # sprite covers a tile when both pixel distances are below 8, i.e. one or two
+    # tiles per axis. Slots are stamped last to first so the lowest slot wins.
+    grid = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH), dtype=np.uint8)
+    for slot in range(len(sprite_positions) - 1, -1, -1):
+        sprite_x, sprite_y = sprite_positions[slot]
+        grid[
+            sprite_y // 8 : (sprite_y + 7) // 8 + 1,
+            sprite_x // 8 : (sprite_x + 7) // 8 + 1,
+        ] = slot + 1
+    return grid
+
+
+def read_tile_matrix(memory_view: PyBoyMemoryView) -> TileMatrix | None:
+    """
+    Read the entire visible screen into a column-wise TileMatrix.
+
+    Args:
+        memory_view: PyBoy memory view for accessing game memory
+
+    Returns:
+        TileMatrix covering the 20x18 screen, or None if the map is
+        transitioning/loading or the tileset is unknown
+    """
+    screen = read_screen_inputs(memory_view)
+    if screen is None:
+        return None
+    return build_tile_matrix(memory_view, screen)
+
+
+def read_screen_inputs(memory_view: PyBoyMemoryView) -> ScreenInputs | None:
+    """
+    Read the memory a TileMatrix is computed from.
+
+    Args:
+        memory_view: PyBoy memory view for accessing game memory
+
+    Returns:
+        ScreenInputs for build_tile_matrix, or None if the map is
+        transitioning/loading or the tileset is unknown
+    """
     # Check if map is stable before analysis
-    try:
-        loading_status = memory_view[MemoryAddresses.map_loading_status]
-        # Allow common stable values: 0 (classic stable), 16 (stable - observed in init.state)
-        # Only treat values 1-3 as actively transitioning states based on Pokemon Red source
-        if 1 <= loading_status <= 3:  # Map is actively transitioning
-            return []
-    except Exception:
-        # If we can't read loading status, assume map is stable for tests
-        pass
-
-    tiles = []
-    for y in range(18):  # Screen height
-        for x in range(20):  # Screen width
-            try:
-                tile_data = read_single_tile(memory_view, x, y)
-                tiles.append(tile_data)
-            except Exception:
-                # Skip problematic tiles during batch processing
-                continue
-
-    return tiles
+    loading_status = memory_view[MemoryAddresses.map_loading_status]
+    # Allow common stable values: 0 (classic stable), 16 (stable - observed in init.state)
+    # Only treat values 1-3 as actively transitioning states based on Pokemon Red source
+    if 1 <= loading_status <= 3:  # Map is actively transitioning
+        return None
+
+    tileset_byte = memory_view[MemoryAddresses.current_tileset]
+    if tileset_byte >= len(TILESETS_BY_ID):
+        # Unknown tileset byte: no tile on screen can be classified
+        return None
+
+    return ScreenInputs(
+        tileset_byte=tileset_byte,
+        player_x=memory_view[MemoryAddresses.x_coord],
+        player_y=memory_view[MemoryAddresses.y_coord],
+        current_map=memory_view[MemoryAddresses.current_map],
+        tile_map=bytes(memory_view[_TILE_MAP]),
+        sprite_table=bytes(memory_view[_SPRITE_STATE_TABLE]),
+        collision_table=_read_collision_table(memory_view),
+    )
+
+
+def build_tile_matrix(memory_view: PyBoyMemoryView, screen: ScreenInputs) -> TileMatrix:
+    """
+    Build the column-wise TileMatrix for screen inputs read by read_screen_inputs.
+
+    Args:
+        memory_view: PyBoy memory view the inputs were read from
+        screen: Screen inputs returned by read_screen_inputs
+
+    Returns:
+        TileMatrix covering the 20x18 screen
+    """
+    tileset_id = TILESETS_BY_ID[screen.tileset_byte]
+    player_x, player_y = screen.player_x, screen.player_y
+
+    tile_ids = np.frombuffer(screen.tile_map, dtype=np.uint8).reshape(
+        SCREEN_HEIGHT, SCREEN_WIDTH
+    )
+
+    # Screen-to-map offsets are the same for every tile
+    map_x0 = player_x - PLAYER_SCREEN_X
+    map_y0 = player_y - PLAYER_SCREEN_Y
+
+    # A screen only shows a few dozen distinct tile ids, so type and property
+    # lookups run once per distinct id and are then gathered per cell; the
+    # collision table is read once for the whole screen
+    unique_ids, cell_index = np.unique(tile_ids, return_inverse=True)
+    cell_index = cell_index.reshape(tile_ids.shape)
+    unique_walkable = _walkable_table(memory_view, screen.collision_table)[unique_ids]
+    properties = TilePropertyDetector.detect_all_batch(tileset_id, unique_ids)
+    trainer_sight = TilePropertyDetector.detect_trainer_sight_line(
+        memory_view, map_x0, map_y0
+    )
+    unique_columns = {
+        "tile_id": unique_ids,
+        "tile_type": classify_tile_type_codes(unique_ids, unique_walkable, tileset_id),
+        "tileset_id": np.full(unique_ids.shape, tileset_id),
+        "raw_value": unique_ids,
+        "is_walkable": unique_walkable,
+        "trainer_sight_line": np.full(unique_ids.shape, trainer_sight["in_sight_line"]),
+        "trainer_id": np.full(unique_ids.shape, trainer_sight["trainer_id"]),
+        **{field: properties[key] for field, key in _PROPERTY_COLUMNS.items()},
+    }
+
+    columns = {
+        name: np.asarray(unique_columns[name], dtype=dtype)[cell_index]
+        for name, dtype in TILE_MATRIX_COLUMNS.items()
+        if name in unique_columns
+    }
+
+    columns["map_x"] = np.tile(
+        np.arange(map_x0, map_x0 + SCREEN_WIDTH, dtype=np.int16), (SCREEN_HEIGHT, 1)
+    )
+    columns["map_y"] = np.tile(
+        np.arange(map_y0, map_y0 + SCREEN_HEIGHT, dtype=np.int16)[:, None],
+        (1, SCREEN_WIDTH),
+    )
+    # Sprite positions are read once per frame and matched against the whole grid
+    columns["sprite_offset"] = _sprite_offset_grid(
+        _sprite_positions(screen.sprite_table)
+    )
+
+    return TileMatrix(
+        columns=columns,
+        width=SCREEN_WIDTH,
+        height=SCREEN_HEIGHT,
+        current_map=screen.current_map,
+        player_x=player_x,
+        player_y=player_y,
+    )
 
 
 def read_single_tile(memory_view: PyBoyMemoryView, x: int, y: int) -> TileData:
@@ -384,7 +458,7 @@ def read_single_tile(memory_view: PyBoyMemoryView, x: int, y: int) -> TileData:
         memory_view, tileset_id, tile_id, map_x, map_y
     )
 
-    return TileData(
+    return TileDataFactory.create_tile(
         # Basic Identification
         tile_id=tile_id,
         x=x,
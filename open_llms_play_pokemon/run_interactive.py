@@ -105,11 +105,14 @@ class InteractiveRunner:
             logger.info("Press Ctrl+C to exit and save state")
             logger.info("========================")
 
-            # Keep the game running until interrupted
+            # Keep the game running until interrupted. SDL keeps the keyboard state
+            # array up to date as PyBoy pumps events each tick, and the pointer is
+            # valid for the lifetime of the app, so it is fetched once. Events are
+            # not polled here, as that would take input away from PyBoy's window.
+            keyboard_state = sdl2.keyboard.SDL_GetKeyboardState(None)
             q_key_was_pressed = False
             try:
                 while True:
-                    keyboard_state = sdl2.keyboard.SDL_GetKeyboardState(None)
                     q_key_pressed = keyboard_state[sdl2.scancode.SDL_SCANCODE_Q]
                     if q_key_pressed and not q_key_was_pressed:
                         logger.info("Q key pressed - saving capture")
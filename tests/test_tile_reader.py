@@ -1,11 +1,18 @@
 """Tests for enhanced tile creator system."""
 
+from typing import cast
 from unittest.mock import MagicMock, Mock
 
 import pytest
 from game_state.data.tile_data_constants import TilesetID
 from game_state.tile_data import TileType
 from game_state.tile_reader import read_single_tile
+from pyboy import PyBoyMemoryView
+
+
+def fake_memory_view(memory: bytes | bytearray) -> PyBoyMemoryView:
+    """Use a 64KB buffer as a PyBoy memory view; both index the same way."""
+    return cast(PyBoyMemoryView, memory)
 
 
 def test_detect_ledge_info():
@@ -29,6 +36,23 @@ def test_detect_ledge_info():
     assert direction is None
 
 
+def test_detect_ledge_directions_matches_scalar():
+    """Test batch ledge lookup against detect_ledge_info for every tile."""
+    import numpy as np
+
+    from open_llms_play_pokemon.game_state.tile_property_detector import (
+        TilePropertyDetector,
+    )
+
+    tile_ids = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    for tileset_id in TilesetID:
+        directions = TilePropertyDetector.detect_ledge_directions(tileset_id, tile_ids)
+        assert directions.shape == tile_ids.shape
+        for tile_id, direction in enumerate(directions.ravel().tolist()):
+            expected, _ = TilePropertyDetector.detect_ledge_info(tileset_id, tile_id)
+            assert direction == expected
+
+
 def test_detect_interaction_properties():
     """Test interaction property detection."""
     from open_llms_play_pokemon.game_state.tile_property_detector import (
@@ -71,6 +95,120 @@ def test_detect_environmental_properties():
     assert env_props["is_encounter"] is False
 
 
+def test_detect_all_properties_matches_individual_detectors():
+    """Test the table-driven detect_all_properties against the per-property detectors."""
+    from open_llms_play_pokemon.game_state.tile_property_detector import (
+        TilePropertyDetector,
+    )
+
+    memory_view = fake_memory_view(bytes(0x10000))
+
+    for tileset_id in TilesetID:
+        for tile_id in range(256):
+            ledge_direction, is_ledge = TilePropertyDetector.detect_ledge_info(
+                tileset_id, tile_id
+            )
+            expected = {
+                "ledge_direction": ledge_direction,
+                "is_ledge": is_ledge,
+                **TilePropertyDetector.detect_audio_properties(tileset_id, tile_id),
+                **TilePropertyDetector.detect_trainer_sight_line(memory_view, 0, 0),
+                **TilePropertyDetector.detect_special_properties(
+                    tileset_id, tile_id, 0, 0
+                ),
+                **TilePropertyDetector.detect_animation_info(tileset_id, tile_id),
+                **TilePropertyDetector.detect_interaction_properties(
+                    tileset_id, tile_id
+                ),
+                **TilePropertyDetector.detect_environmental_properties(
+                    tileset_id, tile_id
+                ),
+            }
+            assert (
+                TilePropertyDetector.detect_all_properties(
+                    memory_view, tileset_id, tile_id, 0, 0
+                )
+                == expected
+            )
+
+
+def test_detect_all_batch_matches_detect_all_properties():
+    """Test the batched detector against detect_all_properties for every tile."""
+    import numpy as np
+
+    from open_llms_play_pokemon.game_state.tile_property_detector import (
+        TilePropertyDetector,
+    )
+
+    memory_view = fake_memory_view(bytes(0x10000))
+    tile_ids = np.arange(256, dtype=np.uint8)
+    for tileset_id in TilesetID:
+        batch = TilePropertyDetector.detect_all_batch(tileset_id, tile_ids)
+        for tile_id in range(256):
+            expected = TilePropertyDetector.detect_all_properties(
+                memory_view, tileset_id, tile_id, 0, 0
+            )
+            sight_keys = {"in_sight_line", "trainer_id", "sight_distance"}
+            assert set(batch) == set(expected) - sight_keys
+            for key, values in batch.items():
+                assert values[tile_id] == expected[key], (tileset_id, tile_id, key)
+
+
+def test_detector_results_are_shared():
+    """Test that equal detector results are the same read-only mapping."""
+    from open_llms_play_pokemon.game_state.tile_property_detector import (
+        TilePropertyDetector,
+    )
+
+    memory_view = fake_memory_view(bytes(0x10000))
+    detectors = [
+        lambda tile_id: TilePropertyDetector.detect_special_properties(
+            TilesetID.OVERWORLD, tile_id, 0, 0
+        ),
+        lambda tile_id: TilePropertyDetector.detect_animation_info(
+            TilesetID.OVERWORLD, tile_id
+        ),
+        lambda tile_id: TilePropertyDetector.detect_interaction_properties(
+            TilesetID.OVERWORLD, tile_id
+        ),
+        lambda tile_id: TilePropertyDetector.detect_environmental_properties(
+            TilesetID.OVERWORLD, tile_id
+        ),
+        lambda tile_id: TilePropertyDetector.detect_all_properties(
+            memory_view, TilesetID.OVERWORLD, tile_id, 0, 0
+        ),
+    ]
+    # 0x52 is grass, 0x3D a cuttable tree and 0x1B a warp on the overworld
+    for detect in detectors:
+        for tile_id in (0x00, 0x52, 0x3D, 0x1B):
+            assert detect(tile_id) is detect(tile_id)
+            # Shared results are read-only, so no caller can change another's
+            with pytest.raises(TypeError):
+                detect(tile_id)["is_warp"] = True  # type: ignore[index]
+
+
+def test_property_masks_match_tile_constants():
+    """Test the (tileset, tile_id) masks against the per-tileset tile sets."""
+    from open_llms_play_pokemon.game_state.data import tile_data_constants as constants
+    from open_llms_play_pokemon.game_state.data import tile_masks
+
+    mask_tables = [
+        (tile_masks.GRASS_MASK, constants.GRASS_TILES),
+        (tile_masks.WATER_MASK, constants.WATER_TILES),
+        (tile_masks.WARP_MASK, constants.WARP_TILES),
+        (tile_masks.DOOR_MASK, constants.DOOR_TILES),
+        (tile_masks.TREE_MASK, constants.TREE_TILES),
+        (tile_masks.SIGN_MASK, constants.SIGN_TILES),
+        (tile_masks.BOOKSHELF_MASK, constants.BOOKSHELF_TILES),
+        (tile_masks.STRENGTH_BOULDER_MASK, constants.STRENGTH_BOULDER_TILES),
+        (tile_masks.PC_MASK, constants.PC_TILES),
+    ]
+    for mask, table in mask_tables:
+        for tileset_id in TilesetID:
+            expected = table.get(tileset_id, set())
+            assert set(mask[tileset_id].nonzero()[0].tolist()) == expected
+
+
 def test_create_tile_data_integration(monkeypatch):
     """Test create_tile_data function with mocked memory view."""
     # Create mock memory view
@@ -78,13 +216,20 @@ def test_create_tile_data_integration(monkeypatch):
     memory_view.__getitem__ = MagicMock()
 
     # Mock memory addresses
-    memory_view.__getitem__.side_effect = lambda addr: {
+    memory_data = {
         0xD367: 0,  # current_tileset = OVERWORLD
         0xD362: 10,  # x_coord = 10
         0xD361: 10,  # y_coord = 10
         0xD36A: 0,  # map_loading_status = stable
         0xC3A0: 0x52,  # tile_map_buffer + 0 = grass tile
-    }.get(addr, 0)
+    }
+
+    def mock_getitem(addr):
+        if isinstance(addr, slice):
+            return [memory_data.get(a, 0) for a in range(addr.start, addr.stop)]
+        return memory_data.get(addr, 0)
+
+    memory_view.__getitem__.side_effect = mock_getitem
 
     # Mock the tile reader functions using monkeypatch
     def mock_get_tile_id(memory_view, x, y):
@@ -130,5 +275,201 @@ def test_create_tile_data_integration(monkeypatch):
     assert tile_data.tile_type == TileType.GRASS
 
 
+def test_read_entire_screen_matches_single_tile_reads():
+    """Test the bulk screen read against per-tile reads on the same memory."""
+    from game_state.data.memory_addresses import MemoryAddresses
+    from game_state.tile_reader import read_entire_screen
+
+    memory = bytearray(0x10000)
+    memory[MemoryAddresses.current_tileset] = TilesetID.OVERWORLD
+    memory[MemoryAddresses.x_coord] = 12
+    memory[MemoryAddresses.y_coord] = 7
+    tile_map = MemoryAddresses.tile_map_buffer
+    for offset in range(20 * 18):
+        memory[tile_map + offset] = (offset * 7) % 0x60
+    # One sprite standing on screen tile (3, 5)
+    memory[MemoryAddresses.sprite_state_data + 16 + 4] = 5 * 8
+    memory[MemoryAddresses.sprite_state_data + 16 + 6] = 3 * 8
+    memory_view = fake_memory_view(memory)
+
+    tiles = read_entire_screen(memory_view)
+
+    assert len(tiles) == 360
+    assert tiles == [
+        read_single_tile(memory_view, x, y) for y in range(18) for x in range(20)
+    ]
+    assert tiles[5 * 20 + 3].sprite_offset == 2
+
+
+def test_read_tile_matrix_encounter_and_warp_follow_tileset_masks():
+    """Test encounter/warp columns use per-tileset tile sets, not tileset keys."""
+    import numpy as np
+    from game_state.data.memory_addresses import MemoryAddresses
+    from game_state.data.tile_masks import DOOR_MASK, GRASS_MASK, WARP_MASK
+    from game_state.tile_data import TILE_TYPE_CODES
+    from game_state.tile_reader import read_tile_matrix
+
+    memory = bytearray(0x10000)
+    tile_map = MemoryAddresses.tile_map_buffer
+    memory[tile_map : tile_map + 360] = bytes(range(256)) + bytes(range(104))
+    tile_ids = np.frombuffer(memory, np.uint8, 360, tile_map).reshape(18, 20)
+
+    for tileset_id in TilesetID:
+        memory[MemoryAddresses.current_tileset] = tileset_id
+        matrix = read_tile_matrix(fake_memory_view(memory))
+        assert matrix is not None
+
+        np.testing.assert_array_equal(
+            matrix.encounter_mask, GRASS_MASK[tileset_id][tile_ids]
+        )
+        np.testing.assert_array_equal(
+            matrix.warp_mask, (WARP_MASK | DOOR_MASK)[tileset_id][tile_ids]
+        )
+        np.testing.assert_array_equal(
+            matrix.encounter_mask,
+            matrix.columns["tile_type"] == TILE_TYPE_CODES[TileType.GRASS],
+        )
+
+
+def test_sprite_offset_grid_matches_per_tile_scan():
+    """Test the vectorized sprite grid against the per-tile sprite scan."""
+    import random
+
+    from game_state.tile_reader import _sprite_offset_at, _sprite_offset_grid
+
+    rng = random.Random(0)
+    for _ in range(20):
+        # Include off-screen and overlapping sprites
+        sprite_positions = [
+            (rng.randrange(0, 256), rng.randrange(0, 256)) for _ in range(16)
+        ]
+        sprite_positions[3] = sprite_positions[7]
+        # Tile-aligned, one pixel off alignment and screen-edge positions
+        sprite_positions[:5] = [(0, 0), (7, 9), (8, 8), (152, 136), (159, 143)]
+        grid = _sprite_offset_grid(sprite_positions)
+        assert grid.shape == (18, 20)
+        assert grid.tolist() == [
+            [_sprite_offset_at(sprite_positions, x, y) for x in range(20)]
+            for y in range(18)
+        ]
+
+
+def test_fallback_walkable_table_uses_collision_tables():
+    """Test the fallback walkable tables against the collision tile sets."""
+    from game_state.tile_reader import _fallback_walkable_table, is_collision_tile
+
+    from open_llms_play_pokemon.game_state.data.tile_data_constants import (
+        COLLISION_TABLES,
+    )
+    from open_llms_play_pokemon.game_state.data.tile_masks import WALKABLE_MASK
+
+    for tileset_id in TilesetID:
+        expected = COLLISION_TABLES.get(tileset_id, set())
+        assert set(WALKABLE_MASK[tileset_id].nonzero()[0].tolist()) == expected
+
+        # A zero collision pointer is out of ROM space and falls back
+        memory = bytearray(0x10000)
+        memory[0xD367] = tileset_id
+        memory_view = fake_memory_view(memory)
+        walkable = _fallback_walkable_table(memory_view)
+        assert set(walkable.nonzero()[0].tolist()) == expected
+        blocked = [
+            tile_id for tile_id in range(256) if is_collision_tile(memory_view, tile_id)
+        ]
+        assert set(blocked) == set(range(256)) - expected
+
+    # Unknown tilesets have no walkable tiles
+    memory = bytearray(0x10000)
+    memory[0xD367] = len(TilesetID)
+    memory_view = fake_memory_view(memory)
+    assert not _fallback_walkable_table(memory_view).any()
+    assert is_collision_tile(memory_view, 0x00)
+
+
+def test_walkable_table_reads_rom_collision_table():
+    """Test that the screen read and per-tile checks share the ROM table."""
+    from game_state.data.memory_addresses import MemoryAddresses
+    from game_state.data.tile_masks import WALKABLE_MASK
+    from game_state.tile_reader import (
+        is_collision_tile,
+        read_tile_matrix,
+        read_walkable_table,
+    )
+
+    memory = bytearray(0x10000)
+    memory[MemoryAddresses.current_tileset] = TilesetID.OVERWORLD
+    memory[MemoryAddresses.tileset_collision_ptr] = 0x00
+    memory[MemoryAddresses.tileset_collision_ptr + 1] = 0x40
+    memory[0x4000:0x4004] = bytes([0x05, 0x52, 0x07, 0xFF])
+    tile_map = MemoryAddresses.tile_map_buffer
+    for offset in range(20 * 18):
+        memory[tile_map + offset] = offset % 0x60
+    memory_view = fake_memory_view(memory)
+
+    walkable = read_walkable_table(memory_view)
+    assert walkable.nonzero()[0].tolist() == [0x05, 0x07, 0x52]
+    assert is_collision_tile(memory_view, 0x00)
+    assert not is_collision_tile(memory_view, 0x52)
+    assert is_collision_tile(memory_view, 999)
+
+    matrix = read_tile_matrix(memory_view)
+    assert matrix is not None
+    assert matrix.walkable_mask.tolist() == [
+        [not is_collision_tile(memory_view, (y * 20 + x) % 0x60) for x in range(20)]
+        for y in range(18)
+    ]
+
+    # A table without a terminator falls back to the hardcoded tables
+    memory[0x4000:0x4100] = bytes([0x05]) * 0x100
+    assert read_walkable_table(memory_view).tolist() == (
+        WALKABLE_MASK[TilesetID.OVERWORLD].tolist()
+    )
+
+
+def test_memory_reader_reuses_unchanged_screen():
+    """Test that an unchanged screen returns the previous, read-only matrix."""
+    from game_state.data.memory_addresses import MemoryAddresses
+    from game_state.memory_reader import PokemonRedMemoryReader
+
+    memory = bytearray(0x10000)
+    memory[MemoryAddresses.x_coord] = 12
+    memory[MemoryAddresses.y_coord] = 7
+    reader = PokemonRedMemoryReader(Mock())
+    other_reader = PokemonRedMemoryReader(Mock())
+
+    def read(reader, memory):
+        return reader._process_tile_data(fake_memory_view(memory))["tile_matrix"]
+
+    first = read(reader, memory)
+    assert read(reader, bytearray(memory)) is first
+    # Each reader keeps its own last screen
+    assert read(other_reader, memory) is not first
+
+    # Shared matrices cannot be changed by one of their callers
+    assert not first.walkable_mask.flags.writeable
+    assert not first.scan_flags.flags.writeable
+    with pytest.raises(ValueError):
+        first.walkable_mask[0, 0] = True
+
+    # Any input of the matrix invalidates it
+    changes = [
+        (MemoryAddresses.tile_map_buffer + 21, 0x52),
+        (MemoryAddresses.sprite_state_data + 16 + 4, 5 * 8),
+        (MemoryAddresses.current_tileset, TilesetID.REDS_HOUSE_1),
+        (MemoryAddresses.current_map, 1),
+        (MemoryAddresses.x_coord, 13),
+    ]
+    previous = first
+    for address, value in changes:
+        memory[address] = value
+        matrix = read(reader, memory)
+        assert matrix is not previous
+        assert matrix.to_dict() == read(other_reader, bytearray(memory)).to_dict()
+        previous = matrix
+
+    assert previous.columns["sprite_offset"][5, 0] == 2
+    assert previous.tile_ids[1, 1] == 0x52
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
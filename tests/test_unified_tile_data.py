@@ -1,9 +1,16 @@
 """Tests for the unified tile data system."""
 
+from typing import cast
+
+import numpy as np
+import pytest
+
 from open_llms_play_pokemon.game_state.data.tile_data_constants import TilesetID
 from open_llms_play_pokemon.game_state.tile_data import (
     TileType,
+    _classify_tile_type,
     classify_tile_type,
+    classify_tile_types,
     is_tile_walkable,
 )
 
@@ -31,6 +38,37 @@ def test_tile_type_classification():
     print("✓ Tile type classification test passed")
 
 
+def test_vectorized_classification_matches_scalar():
+    """Test the precomputed classification tables against the per-tile rules."""
+    tile_ids = np.arange(256, dtype=np.uint8)
+    for tileset_id in TilesetID:
+        for is_walkable in (True, False):
+            walkable = np.full(tile_ids.shape, is_walkable)
+            types = classify_tile_types(tile_ids, walkable, tileset_id)
+            expected = [
+                _classify_tile_type(tile_id, is_walkable, tileset_id)
+                for tile_id in range(256)
+            ]
+            assert types.tolist() == expected
+            assert [
+                classify_tile_type(tile_id, is_walkable, tileset_id)
+                for tile_id in range(256)
+            ] == expected
+
+
+def test_classification_of_unknown_ids():
+    """Test out-of-range tileset and tile IDs fall back instead of raising."""
+    unknown_tileset = cast(TilesetID, 30)
+    assert classify_tile_type(5, True, unknown_tileset) == TileType.WALKABLE
+    assert classify_tile_type(5, False, unknown_tileset) == TileType.BLOCKED
+    assert classify_tile_type(5, True, cast(TilesetID, -1)) == TileType.WALKABLE
+
+    # Negative IDs must not wrap around to the end of the tables
+    assert classify_tile_type(-1, True, TilesetID.OVERWORLD) == TileType.WALKABLE
+    assert classify_tile_type(256, True, TilesetID.OVERWORLD) == TileType.WALKABLE
+    assert classify_tile_type(-1, False, TilesetID.OVERWORLD) == TileType.BLOCKED
+
+
 def test_collision_detection():
     """Test collision detection system."""
 
@@ -52,3 +90,140 @@ def test_collision_detection():
     assert not is_tile_walkable(
         0x01, TilesetID.OVERWORLD
     )  # 0x01 is not in overworld collision table
+
+
+def test_factory_tiles_are_interned():
+    """Identical factory tiles share a single immutable instance."""
+    from open_llms_play_pokemon.game_state.tile_data_factory import TileDataFactory
+
+    first = TileDataFactory.create_walkable(0x10, 3, 4, 13, 14)
+    second = TileDataFactory.create_walkable(0x10, 3, 4, 13, 14)
+    assert first is second
+
+    moved = TileDataFactory.create_walkable(0x10, 3, 4, 14, 14)
+    assert moved is not first
+    assert moved.map_x == 14
+
+    # Equal values of another type are not interned together
+    plain = TileDataFactory.create_walkable(
+        0x10, 3, 4, 13, 14, tileset_id=cast(TilesetID, 0)
+    )
+    overworld = TileDataFactory.create_walkable(
+        0x10, 3, 4, 13, 14, tileset_id=TilesetID.OVERWORLD
+    )
+    assert type(plain.tileset_id) is int
+    assert overworld.tileset_id is TilesetID.OVERWORLD
+    assert type(TileDataFactory.create_placeholder(True, False).x) is bool
+    assert type(TileDataFactory.create_placeholder(1, 0).x) is int
+
+
+def test_tile_data_is_slotted_and_frozen():
+    """TileData instances carry no per-instance __dict__ and cannot be mutated."""
+    import dataclasses
+
+    import pytest
+
+    from open_llms_play_pokemon.game_state.tile_data_factory import TileDataFactory
+
+    tile = TileDataFactory.create_placeholder(1, 2)
+    assert not hasattr(tile, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        tile.is_walkable = True  # type: ignore[misc]
+
+
+def test_factory_base_tile_matches_field_order():
+    """Factory defaults line up with TileData's positional field order."""
+    from open_llms_play_pokemon.game_state.tile_data_factory import (
+        _BASE_TILE,
+        _TILE_DATA_FIELD_ORDER,
+    )
+
+    assert tuple(_BASE_TILE) == _TILE_DATA_FIELD_ORDER
+
+
+def test_placeholder_grid_is_shared_but_rows_are_copied():
+    """Placeholder grids reuse tiles but hand out independent row lists."""
+    from open_llms_play_pokemon.game_state.tile_data_factory import TileDataFactory
+
+    first = TileDataFactory.create_placeholder_grid(20, 18)
+    second = TileDataFactory.create_placeholder_grid(20, 18)
+
+    assert len(first) == 18 and len(first[0]) == 20
+    assert first[9][8] == TileDataFactory.create_placeholder(8, 9)
+    assert first[9][8] is second[9][8]
+
+    first[9][8] = TileDataFactory.create_walkable(0x10, 8, 9, 8, 9)
+    assert second[9][8].tile_type.value == "unknown"
+
+
+def test_tile_matrix_columns_round_trip():
+    """Column-wise TileMatrix rebuilds the same tiles and serializes to JSON."""
+    from open_llms_play_pokemon.game_state.tile_data import (
+        ANIMATED_BIT,
+        ENCOUNTER_BIT,
+        WALKABLE_BIT,
+        WARP_BIT,
+        TileMatrix,
+    )
+    from open_llms_play_pokemon.game_state.tile_data_factory import TileDataFactory
+
+    tiles = TileDataFactory.create_placeholder_grid(20, 18)
+    tiles[3][4] = TileDataFactory.create_water(
+        0x14, 4, 3, 14, 13, current_direction="up"
+    )
+    tiles[5][6] = TileDataFactory.create_ledge(0x37, 6, 5, 16, 15, direction="down")
+    matrix = TileMatrix.from_tiles(
+        tiles=tiles, width=20, height=18, current_map=1, player_x=10, player_y=9
+    )
+
+    assert matrix.get_tile(4, 3) == tiles[3][4]
+    assert matrix.get_tile(6, 5) == tiles[5][6]
+    assert matrix.get_tile(20, 0) is None
+    assert matrix.tiles == tiles
+    assert matrix.walkable_mask.sum() == 2
+    assert matrix.get_tiles_by_type(TileType.LEDGE) == [tiles[5][6]]
+    assert matrix.get_walkable_tiles() == [tiles[3][4], tiles[5][6]]
+    assert matrix.get_walkable_positions() == [(4, 3), (6, 5)]
+    assert list(matrix.iter_tiles()) == [tile for row in tiles for tile in row]
+    assert matrix.columns["tile_type"].dtype == np.uint8
+    assert matrix.count_tile_types() == {
+        TileType.UNKNOWN: 358,
+        TileType.WATER: 1,
+        TileType.LEDGE: 1,
+    }
+
+    # Water is walkable, an encounter tile and animated; the ledge only walkable
+    assert matrix.scan_flags[3, 4] == (WALKABLE_BIT | ENCOUNTER_BIT | ANIMATED_BIT)
+    assert matrix.scan_flags[5, 6] == WALKABLE_BIT
+    assert np.count_nonzero(matrix.scan_flags) == 2
+    assert not (matrix.scan_flags & WARP_BIT).any()
+
+    restored = TileMatrix.from_json(matrix.to_json())
+    assert restored.tiles == tiles
+    assert restored.to_dict() == matrix.to_dict()
+    assert matrix.to_dict()["tiles"][3][4] == tiles[3][4].to_dict()
+
+    # Matrices compare by value and are unhashable
+    assert restored is not matrix and restored == matrix
+    moved = TileMatrix.from_tiles(
+        tiles=tiles, width=20, height=18, current_map=1, player_x=11, player_y=9
+    )
+    assert moved != matrix
+    tiles[3][4] = TileDataFactory.create_placeholder(4, 3)
+    changed = TileMatrix.from_tiles(
+        tiles=tiles, width=20, height=18, current_map=1, player_x=10, player_y=9
+    )
+    assert changed != matrix
+    with pytest.raises(TypeError):
+        hash(matrix)
+
+
+def test_tilesets_by_id_matches_enum():
+    """Test that the raw-byte tileset table lines up with TilesetID values."""
+    from open_llms_play_pokemon.game_state.data.tile_data_constants import (
+        TILESETS_BY_ID,
+    )
+
+    assert len(TILESETS_BY_ID) == len(TilesetID)
+    for tileset_id in TilesetID:
+        assert TILESETS_BY_ID[tileset_id] is tileset_id
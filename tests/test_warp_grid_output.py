@@ -230,3 +230,18 @@ class TestWarpGridOutput:
             assert row_with_walkable[3] == ".", (
                 f"Expected '.' at position 3, got '{row_with_walkable[3]}' in row: '{row_with_walkable}'"
             )
+
+    def test_environment_actions_are_deduplicated_in_scan_order(self):
+        """Test that interaction labels appear once each, in first-seen order."""
+        row = [{"is_walkable": True} for _ in range(20)]
+        row[3] = {"is_walkable": False, "has_sign": True}
+        row[5] = {"is_walkable": True, "is_warp_tile": True}
+        row[7] = {"is_walkable": False, "has_sign": True, "pc_accessible": True}
+        game_state = {
+            "party_count": 0,
+            "tile_matrix": {"tiles": [row] * 18},
+        }
+
+        output = format_game_state_text(game_state)
+
+        assert "Actions: Sign (read), Door/Warp, PC (access)\n" in output